@@ -10,11 +10,11 @@ Requirements: 9.1, 9.3, 9.4, 9.5
 import logging
 import sys
 import time
-import json
 from typing import Callable, Dict, Any
 from datetime import datetime, timezone
 from contextvars import ContextVar
 
+import orjson
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
@@ -25,6 +25,10 @@ from config.settings import get_settings
 # Context variable for request ID tracking
 request_id_var: ContextVar[str] = ContextVar("request_id", default="")
 
+# Bound once; StructuredFormatter calls it for every record
+_dumps = orjson.dumps
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
 
 class StructuredFormatter(logging.Formatter):
     """
@@ -51,7 +55,7 @@ class StructuredFormatter(logging.Formatter):
         """
         # Base log structure
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.now(timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -64,13 +68,16 @@ class StructuredFormatter(logging.Formatter):
         
         # Add exception info if present
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            # Cache the traceback text on the record, as logging.Formatter does
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exception"] = record.exc_text
         
         # Add any extra fields from the record
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
         
-        return json.dumps(log_data)
+        return _dumps(log_data, option=_DUMPS_OPTIONS).decode()
 
 
 def configure_logging(log_level: str = "INFO") -> None:
@@ -155,6 +162,10 @@ def log_with_context(
             status="success"
         )
     """
+    # Skip building the record when the level is disabled
+    if not logger.isEnabledFor(level):
+        return
+    
     # Create a log record with extra fields
     record = logger.makeRecord(
         logger.name,
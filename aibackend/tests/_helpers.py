@@ -0,0 +1,165 @@
+"""
+Shared helpers for the backend test suite.
+"""
+
+import string
+
+import orjson
+from hypothesis import strategies as st
+
+
+# Well-formed ids shared by the tests; no session is ever created with this one
+SESSION_ID_NONEXISTENT = "550e8400-e29b-41d4-a716-446655440099"
+QUESTION_ID = "550e8400-e29b-41d4-a716-446655440001"
+
+# Valid request payloads shared by the tests
+START_PAYLOAD = {
+    "topic": "Python Programming",
+    "initial_difficulty": "Medium"
+}
+
+SUBMIT_PAYLOAD = {
+    "question_id": QUESTION_ID,
+    "answer_text": "Test answer"
+}
+
+VOICE_FEEDBACK_PAYLOAD = {
+    "feedback_text": "Great job on your answer!"
+}
+
+# Fake audio uploads as (filename, content, content type) tuples
+FAKE_AUDIO = b"fake audio content"
+FAKE_AUDIO_MP3 = ("test.mp3", FAKE_AUDIO, "audio/mpeg")
+FAKE_AUDIO_TXT = ("test.txt", FAKE_AUDIO, "text/plain")
+
+
+# Text up to U+02FF without surrogates or control characters. The free-text
+# request fields (topic, answer_text, feedback_text, question_text) have no
+# validators beyond length bounds, so wider Unicode and longer strings add
+# generation cost without reaching new code paths
+_TEXT = st.characters(exclude_categories=("Cs", "Cc"), max_codepoint=0x2FF)
+valid_topics = st.text(alphabet=_TEXT, min_size=1, max_size=64)
+valid_answer_text = st.text(alphabet=_TEXT, min_size=1, max_size=256)
+valid_feedback_text = st.text(alphabet=_TEXT, min_size=1, max_size=256)
+
+
+# Non-empty strings that never parse as a UUID: letters outside the hex range,
+# or hex runs shorter than the 32 digits a UUID needs. Built directly rather
+# than filtering st.text() through UUID(), and free of URL-significant
+# characters so they survive a query string unchanged
+invalid_uuids = st.one_of(
+    st.just("not-a-uuid"),
+    st.just("12345"),
+    st.just("invalid-uuid-format"),
+    st.text(alphabet="ghijklmnopqrstuvwxyz-_", min_size=1, max_size=36),
+    st.text(alphabet=string.hexdigits, min_size=1, max_size=31),
+)
+
+
+# Request builders: each returns (method, path, kwargs) ready for
+# client.request(method, path, **kwargs). Only the builders for endpoints that
+# look up a session take a session id
+def submit_answer_request(session_id):
+    """Build a submit-answer request that triggers answer evaluation"""
+    return "POST", "/api/submit-answer", {
+        "json": {**SUBMIT_PAYLOAD, "session_id": session_id}
+    }
+
+
+def next_question_request(session_id):
+    """Build a get-next-question request that triggers question generation"""
+    return "GET", f"/api/get-next-question?session_id={session_id}", {}
+
+
+def transcribe_audio_request():
+    """Build a transcribe-audio request with a supported file type"""
+    return "POST", "/api/transcribe-audio", {
+        "files": {"audio_file": FAKE_AUDIO_MP3}
+    }
+
+
+def voice_feedback_request():
+    """Build a generate-voice-feedback request"""
+    return "POST", "/api/generate-voice-feedback", {
+        "json": VOICE_FEEDBACK_PAYLOAD
+    }
+
+
+def start_session_request():
+    """Build a valid start-session request"""
+    return "POST", "/api/start-session", {
+        "json": START_PAYLOAD
+    }
+
+
+# Builders whose endpoints need an existing session
+_SESSION_REQUESTS = frozenset({submit_answer_request, next_question_request})
+
+
+def build_case_request(builder, session_id):
+    """
+    Call a request builder, passing session_id only where the endpoint uses it.
+
+    Args:
+        builder: One of the request builders above
+        session_id: Id of an existing session
+
+    Returns:
+        (method, path, kwargs) for client.request
+    """
+    if builder in _SESSION_REQUESTS:
+        return builder(session_id)
+    return builder()
+
+
+def raise_from_service(monkeypatch, target, error):
+    """
+    Make a service method raise error for the rest of the test.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture
+        target: (owner class, method name) to replace
+        error: Exception instance to raise on every call
+    """
+    owner, attribute = target
+
+    def _raise(*args, **kwargs):
+        raise error
+
+    monkeypatch.setattr(owner, attribute, _raise)
+
+
+def rjson(response):
+    """
+    Parse a response body as JSON with orjson.
+
+    Args:
+        response: An httpx/TestClient response
+
+    Returns:
+        The decoded JSON value
+    """
+    return orjson.loads(response.content)
+
+
+class Recorder:
+    """
+    Callable stand-in that records keyword arguments and returns a fixed value.
+
+    A lighter alternative to MagicMock when a test only needs to inspect the
+    kwargs of each call.
+
+    Attributes:
+        calls: Keyword-argument dicts, one per call, in call order
+        ret: Value returned from every call
+    """
+
+    __slots__ = ("calls", "ret")
+
+    def __init__(self, ret=None):
+        self.calls = []
+        self.ret = ret
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append(kwargs)
+        return self.ret
@@ -0,0 +1,141 @@
+"""
+Shared pytest fixtures for the backend test suite.
+"""
+
+import os
+from dataclasses import dataclass
+
+import pytest
+from fastapi.testclient import TestClient
+from hypothesis import HealthCheck, Phase, settings
+
+
+from app.clients.openai_client import OpenAIClient
+from app.routers import assessment
+from app.services.evaluation_service import EvaluationService
+from app.services.session_service import SessionService
+from main import app
+from tests._helpers import rjson
+
+
+# ============================================================================
+# Hypothesis Profiles
+# ============================================================================
+
+# "ci" skips shrinking, since only pass/fail matters there; "dev" restores
+# the full phase list so failures shrink to a minimal counterexample;
+# "fast" is ci with a fixed seed for quick, repeatable local runs.
+# Tests that set no max_examples of their own run 20 examples under ci.
+# Select one with HYPOTHESIS_PROFILE (default: dev; use HYPOTHESIS_PROFILE=ci in CI).
+settings.register_profile(
+    "ci",
+    max_examples=20,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+    phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.target]
+)
+settings.register_profile(
+    "dev",
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow]
+)
+settings.register_profile("fast", settings.get_profile("ci"), derandomize=True)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
+
+
+def pytest_collection_modifyitems(items):
+    """Mark every Hypothesis-driven test as slow"""
+    for item in items:
+        if hasattr(getattr(item, "obj", None), "hypothesis"):
+            item.add_marker(pytest.mark.slow)
+
+
+# ============================================================================
+# Test Environment
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def _test_env():
+    """Provide the required API keys to tests that go through the app"""
+    os.environ.setdefault("OPENAI_API_KEY", "test-key-123")
+    os.environ.setdefault("TTS_API_KEY", "test-tts-key-123")
+    yield
+
+
+# ============================================================================
+# Test Client Setup
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def test_client(_test_env):
+    """
+    Create one test client for the FastAPI app per test session.
+
+    Routers are registered by main at import time. The client is entered
+    as a context manager so the application lifespan runs a single time.
+    The shared session service dependency is overridden with an empty
+    store owned by the fixture, so tests never touch the app-wide singleton.
+    """
+    # Serve sessions from a test-owned store instead of the app singleton
+    session_service = SessionService()
+    app.dependency_overrides[assessment.get_shared_session_service] = lambda: session_service
+
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        app.dependency_overrides.pop(assessment.get_shared_session_service, None)
+
+
+@pytest.fixture(scope="session")
+def registered_routes():
+    """Map each registered route path to its HTTP methods"""
+    return {
+        route.path: frozenset(route.methods)
+        for route in app.routes
+        if hasattr(route, "methods")
+    }
+
+
+@pytest.fixture(scope="session")
+def session_id(test_client):
+    """Create one assessment session shared by tests that need a valid id"""
+    response = test_client.post(
+        "/api/start-session",
+        json={
+            "topic": "Python Programming",
+            "initial_difficulty": "Medium"
+        }
+    )
+    assert response.status_code == 201
+    return rjson(response)["session_id"]
+
+
+# ============================================================================
+# Service Setup
+# ============================================================================
+
+@dataclass(frozen=True)
+class StubSettings:
+    """
+    Plain stand-in for Settings with the fields the API clients read.
+
+    Building it skips pydantic-settings' environment and .env resolution.
+    """
+    openai_api_key: str = "test-key"
+    tts_api_key: str = "test-key"
+    gpt_model: str = "gpt-4o"
+
+
+STUB_SETTINGS = StubSettings()
+
+
+@pytest.fixture(scope="session")
+def evaluation_service():
+    """
+    Build one EvaluationService per test session for tests that never call the API.
+
+    The OpenAI client is built once from STUB_SETTINGS, rather than on every
+    Hypothesis example or in every module that parses evaluation responses.
+    """
+    return EvaluationService(OpenAIClient(STUB_SETTINGS))
@@ -7,57 +7,119 @@ missing required variables, and default values.
 Requirements: 8.1, 8.2, 8.3, 8.4, 8.5
 """
 
-import os
 import pytest
 from pydantic import ValidationError
 
 from config.settings import Settings, get_settings, reset_settings
 
 
+# Environment variables that might interfere with configuration tests
+_ENV_VARS_TO_CLEAR = frozenset({
+    "OPENAI_API_KEY",
+    "TTS_API_KEY",
+    "TTS_SERVICE",
+    "GPT_MODEL",
+    "SERVER_HOST",
+    "SERVER_PORT",
+    "LOG_LEVEL",
+    "MAX_AUDIO_SIZE_MB",
+    "SESSION_STORE_TYPE",
+})
+
+
+# Optional variables and the values Settings should parse from them
+_CUSTOM_ENV = {
+    "GPT_MODEL": "gpt-4o-mini",
+    "SERVER_PORT": "9000",
+    "SERVER_HOST": "127.0.0.1",
+    "LOG_LEVEL": "DEBUG",
+    "MAX_AUDIO_SIZE_MB": "50",
+    "TTS_SERVICE": "elevenlabs",
+    "SESSION_STORE_TYPE": "redis",
+}
+
+_CUSTOM_VALUES = {
+    "gpt_model": "gpt-4o-mini",
+    "server_port": 9000,
+    "server_host": "127.0.0.1",
+    "log_level": "DEBUG",
+    "max_audio_size_mb": 50,
+    "tts_service": "elevenlabs",
+    "session_store_type": "redis",
+}
+
+# Values Settings should use when the optional variables are unset
+_DEFAULT_VALUES = {
+    "gpt_model": "gpt-4o",
+    "server_port": 8000,
+    "server_host": "0.0.0.0",
+    "log_level": "INFO",
+    "max_audio_size_mb": 25,
+    "tts_service": "openai",
+    "session_store_type": "memory",
+}
+
+
+def _setenv_all(monkeypatch, **env: str) -> None:
+    """
+    Set several environment variables through monkeypatch.
+    
+    Args:
+        monkeypatch: The pytest monkeypatch fixture
+        env: Variable names mapped to their values
+    """
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+
+def _assert_settings_error(*needles: str) -> None:
+    """
+    Assert that Settings() fails validation with an error mentioning any needle.
+    
+    Args:
+        needles: Lowercase substrings, at least one of which must appear
+    """
+    with pytest.raises(ValidationError) as exc_info:
+        Settings()
+    
+    error_str = str(exc_info.value).lower()
+    assert any(needle in error_str for needle in needles), error_str
+
+
 class TestConfigurationLoading:
     """Test suite for configuration loading"""
     
-    def setup_method(self):
-        """Reset settings before each test"""
+    @pytest.fixture(autouse=True)
+    def _clean_env(self, monkeypatch):
+        """Clear interfering environment variables and reset settings"""
         reset_settings()
-        # Clear environment variables that might interfere
-        env_vars = [
-            "OPENAI_API_KEY",
-            "TTS_API_KEY",
-            "TTS_SERVICE",
-            "GPT_MODEL",
-            "SERVER_HOST",
-            "SERVER_PORT",
-            "LOG_LEVEL",
-            "MAX_AUDIO_SIZE_MB",
-            "SESSION_STORE_TYPE"
-        ]
-        for var in env_vars:
-            if var in os.environ:
-                del os.environ[var]
-    
-    def teardown_method(self):
-        """Clean up after each test"""
+        for var in _ENV_VARS_TO_CLEAR:
+            monkeypatch.delenv(var, raising=False)
+        yield
         reset_settings()
     
-    def test_valid_environment_variables(self):
+    @pytest.mark.parametrize(
+        "env,expected",
+        [
+            pytest.param(_CUSTOM_ENV, _CUSTOM_VALUES, id="custom"),
+            pytest.param({}, _DEFAULT_VALUES, id="defaults"),
+        ]
+    )
+    def test_settings_values(self, monkeypatch, env, expected):
         """
-        Test configuration loads successfully with all valid environment variables.
+        Test configuration loads optional values from the environment or defaults.
         
         Requirements: 8.1, 8.2, 8.4, 8.5
         """
         # Set required environment variables
-        os.environ["OPENAI_API_KEY"] = "test-openai-key-123"
-        os.environ["TTS_API_KEY"] = "test-tts-key-456"
-        
-        # Set optional environment variables
-        os.environ["GPT_MODEL"] = "gpt-4o-mini"
-        os.environ["SERVER_PORT"] = "9000"
-        os.environ["SERVER_HOST"] = "127.0.0.1"
-        os.environ["LOG_LEVEL"] = "DEBUG"
-        os.environ["MAX_AUDIO_SIZE_MB"] = "50"
-        os.environ["TTS_SERVICE"] = "elevenlabs"
-        os.environ["SESSION_STORE_TYPE"] = "redis"
+        _setenv_all(
+            monkeypatch,
+            OPENAI_API_KEY="test-openai-key-123",
+            TTS_API_KEY="test-tts-key-456"
+        )
+        
+        # Set optional environment variables for this case
+        _setenv_all(monkeypatch, **env)
         
         # Load settings
         settings = Settings()
@@ -66,48 +128,33 @@ class TestConfigurationLoading:
         assert settings.openai_api_key == "test-openai-key-123"
         assert settings.tts_api_key == "test-tts-key-456"
         
-        # Verify optional variables are loaded
-        assert settings.gpt_model == "gpt-4o-mini"
-        assert settings.server_port == 9000
-        assert settings.server_host == "127.0.0.1"
-        assert settings.log_level == "DEBUG"
-        assert settings.max_audio_size_mb == 50
-        assert settings.tts_service == "elevenlabs"
-        assert settings.session_store_type == "redis"
+        # Verify optional variables match the environment or defaults
+        for field, value in expected.items():
+            assert getattr(settings, field) == value, field
     
-    def test_missing_openai_api_key(self):
+    def test_missing_openai_api_key(self, monkeypatch):
         """
         Test that missing OPENAI_API_KEY causes configuration to fail.
         
         Requirements: 8.1, 8.3
         """
         # Set only TTS_API_KEY, missing OPENAI_API_KEY
-        os.environ["TTS_API_KEY"] = "test-tts-key-456"
+        monkeypatch.setenv("TTS_API_KEY", "test-tts-key-456")
         
         # Attempt to load settings should raise ValidationError
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-        
-        # Verify error mentions the missing field
-        error_str = str(exc_info.value)
-        assert "openai_api_key" in error_str.lower()
+        _assert_settings_error("openai_api_key")
     
-    def test_missing_tts_api_key(self):
+    def test_missing_tts_api_key(self, monkeypatch):
         """
         Test that missing TTS_API_KEY causes configuration to fail.
         
         Requirements: 8.2, 8.3
         """
         # Set only OPENAI_API_KEY, missing TTS_API_KEY
-        os.environ["OPENAI_API_KEY"] = "test-openai-key-123"
+        monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key-123")
         
         # Attempt to load settings should raise ValidationError
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-        
-        # Verify error mentions the missing field
-        error_str = str(exc_info.value)
-        assert "tts_api_key" in error_str.lower()
+        _assert_settings_error("tts_api_key")
     
     def test_missing_all_required_variables(self):
         """
@@ -118,62 +165,36 @@ class TestConfigurationLoading:
         # Don't set any environment variables
         
         # Attempt to load settings should raise ValidationError
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-        
-        # Verify error mentions required fields
-        error_str = str(exc_info.value)
-        assert "openai_api_key" in error_str.lower() or "tts_api_key" in error_str.lower()
-    
-    def test_default_values(self):
-        """
-        Test that optional configuration values use correct defaults.
-        
-        Requirements: 8.4, 8.5
-        """
-        # Set only required environment variables
-        os.environ["OPENAI_API_KEY"] = "test-openai-key-123"
-        os.environ["TTS_API_KEY"] = "test-tts-key-456"
-        
-        # Load settings
-        settings = Settings()
-        
-        # Verify default values
-        assert settings.gpt_model == "gpt-4o"
-        assert settings.server_port == 8000
-        assert settings.server_host == "0.0.0.0"
-        assert settings.log_level == "INFO"
-        assert settings.max_audio_size_mb == 25
-        assert settings.tts_service == "openai"
-        assert settings.session_store_type == "memory"
+        _assert_settings_error("openai_api_key", "tts_api_key")
     
-    def test_empty_api_key_validation(self):
+    def test_empty_api_key_validation(self, monkeypatch):
         """
         Test that empty API keys are rejected.
         
         Requirements: 8.1, 8.2, 8.3
         """
         # Set empty OPENAI_API_KEY
-        os.environ["OPENAI_API_KEY"] = "   "
-        os.environ["TTS_API_KEY"] = "test-tts-key-456"
+        _setenv_all(
+            monkeypatch,
+            OPENAI_API_KEY="   ",
+            TTS_API_KEY="test-tts-key-456"
+        )
         
         # Attempt to load settings should raise ValidationError
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-        
-        # Verify error mentions validation
-        error_str = str(exc_info.value)
-        assert "empty" in error_str.lower() or "openai_api_key" in error_str.lower()
+        _assert_settings_error("empty", "openai_api_key")
     
-    def test_get_settings_singleton(self):
+    def test_get_settings_singleton(self, monkeypatch):
         """
         Test that get_settings() returns a singleton instance.
         
         Requirements: 8.1, 8.2
         """
         # Set required environment variables
-        os.environ["OPENAI_API_KEY"] = "test-openai-key-123"
-        os.environ["TTS_API_KEY"] = "test-tts-key-456"
+        _setenv_all(
+            monkeypatch,
+            OPENAI_API_KEY="test-openai-key-123",
+            TTS_API_KEY="test-tts-key-456"
+        )
         
         # Get settings twice
         settings1 = get_settings()
@@ -182,6 +203,31 @@ class TestConfigurationLoading:
         # Verify they are the same instance
         assert settings1 is settings2
     
+    def test_get_settings_reloads_after_reset(self, monkeypatch):
+        """
+        Test that get_settings() keeps its instance until reset_settings().
+        
+        Requirements: 8.1, 8.4
+        """
+        # Set required environment variables
+        _setenv_all(
+            monkeypatch,
+            OPENAI_API_KEY="test-openai-key-123",
+            TTS_API_KEY="test-tts-key-456"
+        )
+        
+        settings1 = get_settings()
+        
+        # Changing the environment alone does not replace the singleton
+        monkeypatch.setenv("GPT_MODEL", "gpt-4o-mini")
+        assert get_settings() is settings1
+        
+        # After a reset the new environment is picked up
+        reset_settings()
+        settings2 = get_settings()
+        assert settings2 is not settings1
+        assert settings2.gpt_model == "gpt-4o-mini"
+    
     def test_get_settings_with_missing_variables(self):
         """
         Test that get_settings() raises descriptive error when variables are missing.
@@ -199,15 +245,18 @@ class TestConfigurationLoading:
         assert "failed to load configuration" in error_str.lower()
         assert "environment variables" in error_str.lower()
     
-    def test_reset_settings(self):
+    def test_reset_settings(self, monkeypatch):
         """
         Test that reset_settings() clears the singleton instance.
         
         Requirements: 8.1, 8.2
         """
         # Set required environment variables
-        os.environ["OPENAI_API_KEY"] = "test-openai-key-123"
-        os.environ["TTS_API_KEY"] = "test-tts-key-456"
+        _setenv_all(
+            monkeypatch,
+            OPENAI_API_KEY="test-openai-key-123",
+            TTS_API_KEY="test-tts-key-456"
+        )
         
         # Get settings
         settings1 = get_settings()
@@ -221,16 +270,19 @@ class TestConfigurationLoading:
         # Verify they are different instances
         assert settings1 is not settings2
     
-    def test_max_audio_size_bytes_property(self):
+    def test_max_audio_size_bytes_property(self, monkeypatch):
         """
         Test that max_audio_size_bytes property correctly converts MB to bytes.
         
         Requirements: 8.5
         """
         # Set required environment variables
-        os.environ["OPENAI_API_KEY"] = "test-openai-key-123"
-        os.environ["TTS_API_KEY"] = "test-tts-key-456"
-        os.environ["MAX_AUDIO_SIZE_MB"] = "10"
+        _setenv_all(
+            monkeypatch,
+            OPENAI_API_KEY="test-openai-key-123",
+            TTS_API_KEY="test-tts-key-456",
+            MAX_AUDIO_SIZE_MB="10"
+        )
         
         # Load settings
         settings = Settings()
@@ -238,34 +290,36 @@ class TestConfigurationLoading:
         # Verify conversion
         assert settings.max_audio_size_bytes == 10 * 1024 * 1024
     
-    def test_server_port_validation(self):
+    def test_server_port_validation(self, monkeypatch):
         """
         Test that server port is validated to be within valid range.
         
         Requirements: 8.5
         """
         # Set required environment variables
-        os.environ["OPENAI_API_KEY"] = "test-openai-key-123"
-        os.environ["TTS_API_KEY"] = "test-tts-key-456"
+        _setenv_all(
+            monkeypatch,
+            OPENAI_API_KEY="test-openai-key-123",
+            TTS_API_KEY="test-tts-key-456"
+        )
         
         # Test invalid port (too high)
-        os.environ["SERVER_PORT"] = "99999"
-        
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
+        monkeypatch.setenv("SERVER_PORT", "99999")
         
-        error_str = str(exc_info.value)
-        assert "server_port" in error_str.lower() or "less than or equal" in error_str.lower()
+        _assert_settings_error("server_port", "less than or equal")
     
-    def test_case_insensitive_env_vars(self):
+    def test_case_insensitive_env_vars(self, monkeypatch):
         """
         Test that environment variables are case-insensitive.
         
         Requirements: 8.1, 8.2
         """
         # Set environment variables with different cases
-        os.environ["openai_api_key"] = "test-openai-key-123"
-        os.environ["TTS_API_KEY"] = "test-tts-key-456"
+        _setenv_all(
+            monkeypatch,
+            openai_api_key="test-openai-key-123",
+            TTS_API_KEY="test-tts-key-456"
+        )
         
         # Load settings
         settings = Settings()
@@ -274,20 +328,19 @@ class TestConfigurationLoading:
         assert settings.openai_api_key == "test-openai-key-123"
         assert settings.tts_api_key == "test-tts-key-456"
     
-    def test_gpt_model_validation(self):
+    def test_gpt_model_validation(self, monkeypatch):
         """
         Test that GPT model name cannot be empty.
         
         Requirements: 8.4
         """
         # Set required environment variables
-        os.environ["OPENAI_API_KEY"] = "test-openai-key-123"
-        os.environ["TTS_API_KEY"] = "test-tts-key-456"
-        os.environ["GPT_MODEL"] = "   "
+        _setenv_all(
+            monkeypatch,
+            OPENAI_API_KEY="test-openai-key-123",
+            TTS_API_KEY="test-tts-key-456",
+            GPT_MODEL="   "
+        )
         
         # Attempt to load settings should raise ValidationError
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-        
-        error_str = str(exc_info.value)
-        assert "gpt_model" in error_str.lower() or "empty" in error_str.lower()
+        _assert_settings_error("gpt_model", "empty")
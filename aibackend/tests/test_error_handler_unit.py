@@ -7,13 +7,29 @@ and that error responses have the required structure.
 Validates: Requirements 9.2
 """
 
-import os
+import asyncio
 import pytest
 from datetime import datetime
-from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
-
-from main import app
+from functools import lru_cache
+from types import SimpleNamespace
+
+import orjson
+from starlette.requests import Request
+
+import app.middleware.error_handler as error_handler_module
+from tests._helpers import (
+    FAKE_AUDIO_TXT,
+    QUESTION_ID,
+    SESSION_ID_NONEXISTENT,
+    build_case_request,
+    next_question_request,
+    raise_from_service,
+    rjson,
+    start_session_request,
+    submit_answer_request,
+    transcribe_audio_request,
+    voice_feedback_request,
+)
 from app.exceptions import (
     AssessmentError,
     SessionNotFoundError,
@@ -26,36 +42,46 @@ from app.exceptions import (
     QuestionGenerationError,
     EvaluationError,
 )
+from app.services.audio_service import AudioService
+from app.services.evaluation_service import EvaluationService
+from app.services.question_service import QuestionService
+from app.services.session_service import SessionService
+from app.services.voice_service import VoiceService
 
 
 # ============================================================================
-# Test Client Setup
+# Frozen clock
 # ============================================================================
 
-@pytest.fixture(scope="module")
-def test_client():
-    """Create test client for FastAPI app"""
-    # Set required environment variables for testing
-    os.environ.setdefault("OPENAI_API_KEY", "test-key-123")
-    os.environ.setdefault("TTS_API_KEY", "test-tts-key-123")
-    
-    # Register routers if not already registered
-    from app.routers import assessment, audio
-    
-    # Check if routers are already included
-    routes = [route.path for route in app.routes]
-    if "/api/start-session" not in routes:
-        app.include_router(assessment.router)
-    if "/api/transcribe-audio" not in routes:
-        app.include_router(audio.router)
-    
-    return TestClient(app)
+_FROZEN_NOW = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def _frozen_clock(monkeypatch):
+    """Pin error-handler timestamps so every response carries the same value"""
+    monkeypatch.setattr(
+        error_handler_module,
+        "datetime",
+        SimpleNamespace(utcnow=lambda: _FROZEN_NOW, now=lambda tz=None: _FROZEN_NOW)
+    )
 
 
 # ============================================================================
 # Helper function to validate error response structure
 # ============================================================================
 
+_MISSING = object()
+
+# Fields every structured error detail must contain as non-empty strings
+_REQUIRED_ERROR_FIELDS = frozenset({"error_type", "message"})
+
+
+@lru_cache(maxsize=256)
+def _parse_iso(timestamp):
+    """Parse an ISO 8601 timestamp, caching results for repeated strings"""
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
 def validate_error_response_structure(response_json):
     """
     Validate that error response has the required structure.
@@ -69,65 +95,55 @@ def validate_error_response_structure(response_json):
         response_json: The JSON response from the API
     """
     # FastAPI wraps errors in a 'detail' field
-    assert "detail" in response_json, "Error response missing 'detail' field"
-    
-    detail = response_json["detail"]
+    detail = response_json.get("detail", _MISSING)
+    assert detail is not _MISSING, "Error response missing 'detail' field"
     
     # Check for required fields
-    assert "error_type" in detail, "Error response missing 'error_type' field"
-    assert "message" in detail, "Error response missing 'message' field"
+    missing_fields = _REQUIRED_ERROR_FIELDS - detail.keys()
+    assert not missing_fields, \
+        f"Error response missing {sorted(missing_fields)} field(s)"
     
     # Validate field types
-    assert isinstance(detail["error_type"], str), "error_type must be a string"
-    assert isinstance(detail["message"], str), "message must be a string"
-    assert len(detail["error_type"]) > 0, "error_type must not be empty"
-    assert len(detail["message"]) > 0, "message must not be empty"
+    for field in _REQUIRED_ERROR_FIELDS:
+        value = detail[field]
+        assert isinstance(value, str), f"{field} must be a string"
+        assert len(value) > 0, f"{field} must not be empty"
     
     # Timestamp is optional but if present, should be valid
-    if "timestamp" in detail:
+    timestamp = detail.get("timestamp", _MISSING)
+    if timestamp is not _MISSING:
         # Validate timestamp format (should be ISO format datetime string)
         try:
-            datetime.fromisoformat(detail["timestamp"].replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            pytest.fail(f"timestamp is not a valid ISO format datetime: {detail.get('timestamp')}")
+            _parse_iso(timestamp)
+        except (ValueError, AttributeError, TypeError):
+            pytest.fail(f"timestamp is not a valid ISO format datetime: {timestamp}")
 
 
 # ============================================================================
 # Tests for SessionNotFoundError (404)
 # ============================================================================
 
-def test_session_not_found_error_returns_404(test_client):
+def test_session_not_found_error_has_correct_structure(test_client):
     """
-    Test that SessionNotFoundError returns 404 status code.
+    Test that SessionNotFoundError returns 404 with the required structure.
     
     Validates: Requirements 9.2
     """
     # Try to get a question for a non-existent session
     response = test_client.get(
-        "/api/get-next-question?session_id=550e8400-e29b-41d4-a716-446655440000"
+        f"/api/get-next-question?session_id={SESSION_ID_NONEXISTENT}"
     )
     
     # Should return 404 for session not found
     assert response.status_code == 404, \
         f"SessionNotFoundError should return 404, got {response.status_code}"
-
-
-def test_session_not_found_error_has_correct_structure(test_client):
-    """
-    Test that SessionNotFoundError response has required structure.
-    
-    Validates: Requirements 9.2
-    """
-    # Try to get a question for a non-existent session
-    response = test_client.get(
-        "/api/get-next-question?session_id=550e8400-e29b-41d4-a716-446655440000"
-    )
     
     # Validate error response structure
-    validate_error_response_structure(response.json())
+    payload = rjson(response)
+    validate_error_response_structure(payload)
     
     # Check error type is correct
-    detail = response.json()["detail"]
+    detail = payload["detail"]
     assert detail["error_type"] == "SessionNotFoundError", \
         f"Expected error_type 'SessionNotFoundError', got '{detail['error_type']}'"
 
@@ -200,7 +216,7 @@ def test_pydantic_validation_error_has_correct_structure(test_client):
     
     # Pydantic validation errors have a different structure
     # They return a list of errors in the 'detail' field
-    response_json = response.json()
+    response_json = rjson(response)
     assert "detail" in response_json
     assert isinstance(response_json["detail"], list)
 
@@ -209,542 +225,257 @@ def test_pydantic_validation_error_has_correct_structure(test_client):
 # Tests for AudioFileError (400)
 # ============================================================================
 
-def test_audio_file_error_returns_400(test_client):
+def test_audio_file_error_has_correct_structure(test_client):
     """
-    Test that AudioFileError returns 400 status code.
+    Test that AudioFileError returns 400 with the required structure.
     
     Validates: Requirements 9.2
     """
-    from io import BytesIO
-    
-    # Try to transcribe an invalid audio file
-    # Create a file with unsupported extension
-    audio_content = b"fake audio content"
-    audio_file = BytesIO(audio_content)
-    
+    # Try to transcribe a file with an unsupported extension
     response = test_client.post(
         "/api/transcribe-audio",
-        files={"audio_file": ("test.txt", audio_file, "text/plain")}
+        files={"audio_file": FAKE_AUDIO_TXT}
     )
     
     # Should return 400 for invalid audio file
     assert response.status_code == 400, \
         f"AudioFileError should return 400, got {response.status_code}"
-
-
-def test_audio_file_error_has_correct_structure(test_client):
-    """
-    Test that AudioFileError response has required structure.
-    
-    Validates: Requirements 9.2
-    """
-    from io import BytesIO
-    
-    # Try to transcribe an invalid audio file
-    audio_content = b"fake audio content"
-    audio_file = BytesIO(audio_content)
-    
-    response = test_client.post(
-        "/api/transcribe-audio",
-        files={"audio_file": ("test.txt", audio_file, "text/plain")}
-    )
     
     # Validate error response structure
-    validate_error_response_structure(response.json())
+    payload = rjson(response)
+    validate_error_response_structure(payload)
     
     # Check error type is correct
-    detail = response.json()["detail"]
+    detail = payload["detail"]
     assert detail["error_type"] == "AudioFileError", \
         f"Expected error_type 'AudioFileError', got '{detail['error_type']}'"
 
 
 # ============================================================================
-# Tests for OpenAI API Errors (500)
-# ============================================================================
-
-@patch("app.services.evaluation_service.EvaluationService.evaluate_answer")
-def test_openai_api_error_returns_500(mock_evaluate, test_client):
-    """
-    Test that OpenAIAPIError returns 500 status code.
-    
-    Note: The router catches specific exception types before the generic
-    AssessmentError handler, so OpenAIAPIError should return 500.
-    
-    Validates: Requirements 9.2
-    """
-    # Mock the evaluation service to raise OpenAIAPIError
-    mock_evaluate.side_effect = OpenAIAPIError(
-        message="API rate limit exceeded",
-        operation="evaluation"
-    )
-    
-    # First create a session
-    session_response = test_client.post(
-        "/api/start-session",
-        json={
-            "topic": "Python Programming",
-            "initial_difficulty": "Medium"
-        }
-    )
-    session_id = session_response.json()["session_id"]
-    
-    # Try to submit an answer (which will trigger evaluation)
-    response = test_client.post(
-        "/api/submit-answer",
-        json={
-            "session_id": session_id,
-            "question_id": "550e8400-e29b-41d4-a716-446655440001",
-            "answer_text": "Test answer"
-        }
-    )
-    
-    # The router catches AssessmentError (base class) and returns 400
-    # This is a bug in the implementation, but we test current behavior
-    assert response.status_code in [400, 500], \
-        f"OpenAIAPIError should return 400 or 500, got {response.status_code}"
-
-
-@patch("app.services.evaluation_service.EvaluationService.evaluate_answer")
-def test_openai_api_error_has_correct_structure(mock_evaluate, test_client):
-    """
-    Test that OpenAIAPIError response has required structure.
-    
-    Validates: Requirements 9.2
-    """
-    # Mock the evaluation service to raise OpenAIAPIError
-    mock_evaluate.side_effect = OpenAIAPIError(
-        message="API rate limit exceeded",
-        operation="evaluation"
-    )
-    
-    # First create a session
-    session_response = test_client.post(
-        "/api/start-session",
-        json={
-            "topic": "Python Programming",
-            "initial_difficulty": "Medium"
-        }
-    )
-    session_id = session_response.json()["session_id"]
-    
-    # Try to submit an answer
-    response = test_client.post(
-        "/api/submit-answer",
-        json={
-            "session_id": session_id,
-            "question_id": "550e8400-e29b-41d4-a716-446655440001",
-            "answer_text": "Test answer"
-        }
-    )
-    
-    # Validate error response structure
-    validate_error_response_structure(response.json())
-    
-    # Check error type is correct
-    detail = response.json()["detail"]
-    assert detail["error_type"] == "OpenAIAPIError", \
-        f"Expected error_type 'OpenAIAPIError', got '{detail['error_type']}'"
-
-
-# ============================================================================
-# Tests for WhisperAPIError (500)
-# ============================================================================
-
-@patch("app.services.audio_service.AudioService.transcribe_audio")
-def test_whisper_api_error_returns_500(mock_transcribe, test_client):
-    """
-    Test that WhisperAPIError returns 500 status code.
-    
-    Validates: Requirements 9.2
-    """
-    from io import BytesIO
-    
-    # Mock the audio service to raise WhisperAPIError
-    mock_transcribe.side_effect = WhisperAPIError(
-        message="Whisper API unavailable"
-    )
-    
-    # Try to transcribe audio
-    audio_content = b"fake audio content"
-    audio_file = BytesIO(audio_content)
-    
-    response = test_client.post(
-        "/api/transcribe-audio",
-        files={"audio_file": ("test.mp3", audio_file, "audio/mpeg")}
-    )
-    
-    # Should return 500 for Whisper API error
-    assert response.status_code == 500, \
-        f"WhisperAPIError should return 500, got {response.status_code}"
-
-
-@patch("app.services.audio_service.AudioService.transcribe_audio")
-def test_whisper_api_error_has_correct_structure(mock_transcribe, test_client):
-    """
-    Test that WhisperAPIError response has required structure.
-    
-    Validates: Requirements 9.2
-    """
-    from io import BytesIO
-    
-    # Mock the audio service to raise WhisperAPIError
-    mock_transcribe.side_effect = WhisperAPIError(
-        message="Whisper API unavailable"
-    )
-    
-    # Try to transcribe audio
-    audio_content = b"fake audio content"
-    audio_file = BytesIO(audio_content)
-    
-    response = test_client.post(
-        "/api/transcribe-audio",
-        files={"audio_file": ("test.mp3", audio_file, "audio/mpeg")}
-    )
-    
-    # Validate error response structure
-    validate_error_response_structure(response.json())
-    
-    # Check error type is correct
-    detail = response.json()["detail"]
-    assert detail["error_type"] == "WhisperAPIError", \
-        f"Expected error_type 'WhisperAPIError', got '{detail['error_type']}'"
-
-
-# ============================================================================
-# Tests for TTSAPIError (500)
+# Tests for service errors raised behind the API (500)
 # ============================================================================
 
-@patch("app.services.voice_service.VoiceService.generate_voice_feedback")
-def test_tts_api_error_returns_500(mock_generate, test_client):
-    """
-    Test that TTSAPIError returns 500 status code.
-    
-    Validates: Requirements 9.2
-    """
-    # Mock the voice service to raise TTSAPIError
-    mock_generate.side_effect = TTSAPIError(
-        message="TTS service unavailable",
-        service="OpenAI TTS"
-    )
-    
-    # Try to generate voice feedback
-    response = test_client.post(
-        "/api/generate-voice-feedback",
-        json={
-            "feedback_text": "Great job on your answer!"
-        }
-    )
-    
-    # Should return 500 for TTS API error
-    assert response.status_code == 500, \
-        f"TTSAPIError should return 500, got {response.status_code}"
-
-
-@patch("app.services.voice_service.VoiceService.generate_voice_feedback")
-def test_tts_api_error_has_correct_structure(mock_generate, test_client):
-    """
-    Test that TTSAPIError response has required structure.
-    
-    Validates: Requirements 9.2
-    """
-    # Mock the voice service to raise TTSAPIError
-    mock_generate.side_effect = TTSAPIError(
-        message="TTS service unavailable",
-        service="OpenAI TTS"
-    )
-    
-    # Try to generate voice feedback
-    response = test_client.post(
-        "/api/generate-voice-feedback",
-        json={
-            "feedback_text": "Great job on your answer!"
-        }
-    )
-    
-    # Validate error response structure
-    validate_error_response_structure(response.json())
-    
-    # Check error type is correct
-    detail = response.json()["detail"]
-    assert detail["error_type"] == "TTSAPIError", \
-        f"Expected error_type 'TTSAPIError', got '{detail['error_type']}'"
-
-
-# ============================================================================
-# Tests for QuestionGenerationError (500)
-# ============================================================================
-
-@patch("app.services.question_service.QuestionService.generate_question")
-def test_question_generation_error_returns_500(mock_generate, test_client):
-    """
-    Test that QuestionGenerationError returns 500 status code.
-    
-    Validates: Requirements 9.2
-    """
-    # Mock the question service to raise QuestionGenerationError
-    mock_generate.side_effect = QuestionGenerationError(
-        message="Failed to generate question",
-        topic="Python Programming",
-        difficulty="Medium"
-    )
-    
-    # First create a session
-    session_response = test_client.post(
-        "/api/start-session",
-        json={
-            "topic": "Python Programming",
-            "initial_difficulty": "Medium"
-        }
-    )
-    session_id = session_response.json()["session_id"]
-    
-    # Try to get next question
-    response = test_client.get(
-        f"/api/get-next-question?session_id={session_id}"
-    )
-    
-    # Should return 500 for question generation error
-    assert response.status_code == 500, \
-        f"QuestionGenerationError should return 500, got {response.status_code}"
-
-
-@patch("app.services.question_service.QuestionService.generate_question")
-def test_question_generation_error_has_correct_structure(mock_generate, test_client):
-    """
-    Test that QuestionGenerationError response has required structure.
-    
-    Validates: Requirements 9.2
-    """
-    # Mock the question service to raise QuestionGenerationError
-    mock_generate.side_effect = QuestionGenerationError(
-        message="Failed to generate question",
-        topic="Python Programming",
-        difficulty="Medium"
-    )
-    
-    # First create a session
-    session_response = test_client.post(
-        "/api/start-session",
-        json={
-            "topic": "Python Programming",
-            "initial_difficulty": "Medium"
-        }
-    )
-    session_id = session_response.json()["session_id"]
-    
-    # Try to get next question
-    response = test_client.get(
-        f"/api/get-next-question?session_id={session_id}"
-    )
-    
-    # Validate error response structure
-    validate_error_response_structure(response.json())
-    
-    # Check error type is correct
-    detail = response.json()["detail"]
-    assert detail["error_type"] == "QuestionGenerationError", \
-        f"Expected error_type 'QuestionGenerationError', got '{detail['error_type']}'"
-
-
-# ============================================================================
-# Tests for EvaluationError (500)
-# ============================================================================
-
-@patch("app.services.evaluation_service.EvaluationService.evaluate_answer")
-def test_evaluation_error_returns_500(mock_evaluate, test_client):
-    """
-    Test that EvaluationError returns 500 status code.
-    
-    Validates: Requirements 9.2
-    """
-    # Mock the evaluation service to raise EvaluationError
-    mock_evaluate.side_effect = EvaluationError(
-        message="Failed to evaluate answer",
-        question_id="550e8400-e29b-41d4-a716-446655440001"
-    )
-    
-    # First create a session
-    session_response = test_client.post(
-        "/api/start-session",
-        json={
-            "topic": "Python Programming",
-            "initial_difficulty": "Medium"
-        }
-    )
-    session_id = session_response.json()["session_id"]
-    
-    # Try to submit an answer
-    response = test_client.post(
-        "/api/submit-answer",
-        json={
-            "session_id": session_id,
-            "question_id": "550e8400-e29b-41d4-a716-446655440001",
-            "answer_text": "Test answer"
-        }
-    )
-    
-    # Should return 500 for evaluation error
-    assert response.status_code == 500, \
-        f"EvaluationError should return 500, got {response.status_code}"
-
-
-@patch("app.services.evaluation_service.EvaluationService.evaluate_answer")
-def test_evaluation_error_has_correct_structure(mock_evaluate, test_client):
-    """
-    Test that EvaluationError response has required structure.
+# ((owner, attribute) to fail, raised error, request builder, allowed statuses, expected error_type)
+SERVICE_ERROR_CASES = [
+    # The router catches AssessmentError (base class) and may return 400.
+    # This is a bug in the implementation, but we test current behavior.
+    pytest.param(
+        (EvaluationService, "evaluate_answer"),
+        OpenAIAPIError(message="API rate limit exceeded", operation="evaluation"),
+        submit_answer_request, (400, 500), "OpenAIAPIError",
+        id="openai-api-error"
+    ),
+    pytest.param(
+        (AudioService, "transcribe_audio"),
+        WhisperAPIError(message="Whisper API unavailable"),
+        transcribe_audio_request, (500,), "WhisperAPIError",
+        id="whisper-api-error"
+    ),
+    pytest.param(
+        (VoiceService, "generate_voice_feedback"),
+        TTSAPIError(message="TTS service unavailable", service="OpenAI TTS"),
+        voice_feedback_request, (500,), "TTSAPIError",
+        id="tts-api-error"
+    ),
+    pytest.param(
+        (QuestionService, "generate_question"),
+        QuestionGenerationError(
+            message="Failed to generate question",
+            topic="Python Programming",
+            difficulty="Medium"
+        ),
+        next_question_request, (500,), "QuestionGenerationError",
+        id="question-generation-error"
+    ),
+    pytest.param(
+        (EvaluationService, "evaluate_answer"),
+        EvaluationError(
+            message="Failed to evaluate answer",
+            question_id=QUESTION_ID
+        ),
+        submit_answer_request, (500,), "EvaluationError",
+        id="evaluation-error"
+    ),
+    # The router catches generic AssessmentError and may return 400
+    pytest.param(
+        (SessionService, "create_session"),
+        AssessmentError(
+            message="An unexpected error occurred",
+            details={"context": "session creation"}
+        ),
+        start_session_request, (400, 500), "AssessmentError",
+        id="generic-assessment-error"
+    ),
+    # Unexpected exceptions are reported as InternalServerError
+    pytest.param(
+        (SessionService, "create_session"),
+        RuntimeError("Unexpected error"),
+        start_session_request, (500,), "InternalServerError",
+        id="unexpected-exception"
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "target,error,build_request,allowed_statuses,expected_error_type",
+    SERVICE_ERROR_CASES
+)
+def test_service_error_response(
+    monkeypatch,
+    _frozen_clock,
+    test_client,
+    session_id,
+    target,
+    error,
+    build_request,
+    allowed_statuses,
+    expected_error_type
+):
+    """
+    Test that service errors return the right status code and structure.
+    
+    Each case mocks one service method to raise, sends a single request
+    through the API, and checks both the status code and the error body.
     
     Validates: Requirements 9.2
     """
-    # Mock the evaluation service to raise EvaluationError
-    mock_evaluate.side_effect = EvaluationError(
-        message="Failed to evaluate answer",
-        question_id="550e8400-e29b-41d4-a716-446655440001"
-    )
+    method, path, request_kwargs = build_case_request(build_request, session_id)
     
-    # First create a session
-    session_response = test_client.post(
-        "/api/start-session",
-        json={
-            "topic": "Python Programming",
-            "initial_difficulty": "Medium"
-        }
-    )
-    session_id = session_response.json()["session_id"]
+    raise_from_service(monkeypatch, target, error)
+    response = test_client.request(method, path, **request_kwargs)
     
-    # Try to submit an answer
-    response = test_client.post(
-        "/api/submit-answer",
-        json={
-            "session_id": session_id,
-            "question_id": "550e8400-e29b-41d4-a716-446655440001",
-            "answer_text": "Test answer"
-        }
-    )
+    # Check status code
+    assert response.status_code in allowed_statuses, \
+        f"{expected_error_type} should return {allowed_statuses}, got {response.status_code}"
     
     # Validate error response structure
-    validate_error_response_structure(response.json())
+    payload = rjson(response)
+    validate_error_response_structure(payload)
     
     # Check error type is correct
-    detail = response.json()["detail"]
-    assert detail["error_type"] == "EvaluationError", \
-        f"Expected error_type 'EvaluationError', got '{detail['error_type']}'"
+    detail = payload["detail"]
+    assert detail["error_type"] == expected_error_type, \
+        f"Expected error_type '{expected_error_type}', got '{detail['error_type']}'"
 
 
 # ============================================================================
-# Tests for Generic AssessmentError (500)
+# Tests for exception handlers called directly (no ASGI round-trip)
 # ============================================================================
 
-@patch("app.services.session_service.SessionService.create_session")
-def test_generic_assessment_error_returns_500(mock_create, test_client):
+def _call_handler(handler, exc):
+    """Run an async exception handler against a bare HTTP request"""
+    response = asyncio.run(handler(Request(scope={"type": "http"}), exc))
+    return response.status_code, orjson.loads(response.body)
+
+
+# (handler, raised error, expected status, expected error_type)
+HANDLER_CASES = [
+    pytest.param(
+        error_handler_module.assessment_error_handler,
+        SessionNotFoundError(session_id=SESSION_ID_NONEXISTENT),
+        404, "SessionNotFoundError",
+        id="session-not-found"
+    ),
+    pytest.param(
+        error_handler_module.assessment_error_handler,
+        InvalidDifficultyError(difficulty="VeryHard"),
+        400, "InvalidDifficultyError",
+        id="invalid-difficulty"
+    ),
+    pytest.param(
+        error_handler_module.assessment_error_handler,
+        ValidationError(message="Topic must not be empty", field="topic"),
+        400, "ValidationError",
+        id="validation-error"
+    ),
+    pytest.param(
+        error_handler_module.assessment_error_handler,
+        AudioFileError(message="Unsupported audio format", filename="test.txt"),
+        400, "AudioFileError",
+        id="audio-file-error"
+    ),
+    pytest.param(
+        error_handler_module.assessment_error_handler,
+        OpenAIAPIError(message="API rate limit exceeded", operation="evaluation"),
+        500, "OpenAIAPIError",
+        id="openai-api-error"
+    ),
+    pytest.param(
+        error_handler_module.assessment_error_handler,
+        WhisperAPIError(message="Whisper API unavailable"),
+        500, "WhisperAPIError",
+        id="whisper-api-error"
+    ),
+    pytest.param(
+        error_handler_module.assessment_error_handler,
+        TTSAPIError(message="TTS service unavailable", service="OpenAI TTS"),
+        500, "TTSAPIError",
+        id="tts-api-error"
+    ),
+    pytest.param(
+        error_handler_module.assessment_error_handler,
+        QuestionGenerationError(
+            message="Failed to generate question",
+            topic="Python Programming",
+            difficulty="Medium"
+        ),
+        500, "QuestionGenerationError",
+        id="question-generation-error"
+    ),
+    pytest.param(
+        error_handler_module.assessment_error_handler,
+        EvaluationError(
+            message="Failed to evaluate answer",
+            question_id=QUESTION_ID
+        ),
+        500, "EvaluationError",
+        id="evaluation-error"
+    ),
+    pytest.param(
+        error_handler_module.assessment_error_handler,
+        AssessmentError(message="An unexpected error occurred"),
+        500, "AssessmentError",
+        id="generic-assessment-error"
+    ),
+    pytest.param(
+        error_handler_module.generic_exception_handler,
+        RuntimeError("Unexpected error"),
+        500, "InternalServerError",
+        id="unexpected-exception"
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "handler,error,expected_status,expected_error_type",
+    HANDLER_CASES
+)
+def test_exception_handler_response(
+    _frozen_clock,
+    handler,
+    error,
+    expected_status,
+    expected_error_type
+):
     """
-    Test that generic AssessmentError returns appropriate status code.
+    Test that each exception maps to the right status code and structure.
     
-    Note: The router catches AssessmentError and returns 400 for generic errors.
+    The handler is awaited directly, so only the exception-to-response
+    mapping is exercised; the API tests above cover the routed paths.
     
     Validates: Requirements 9.2
     """
-    # Mock the session service to raise generic AssessmentError
-    mock_create.side_effect = AssessmentError(
-        message="An unexpected error occurred",
-        details={"context": "session creation"}
-    )
+    status_code, payload = _call_handler(handler, error)
     
-    # Try to start a session
-    response = test_client.post(
-        "/api/start-session",
-        json={
-            "topic": "Python Programming",
-            "initial_difficulty": "Medium"
-        }
-    )
+    # Check status code
+    assert status_code == expected_status, \
+        f"{expected_error_type} should return {expected_status}, got {status_code}"
     
-    # The router catches AssessmentError and returns 400
-    assert response.status_code in [400, 500], \
-        f"AssessmentError should return 400 or 500, got {response.status_code}"
-
-
-@patch("app.services.session_service.SessionService.create_session")
-def test_generic_assessment_error_has_correct_structure(mock_create, test_client):
-    """
-    Test that generic AssessmentError response has required structure.
-    
-    Validates: Requirements 9.2
-    """
-    # Mock the session service to raise generic AssessmentError
-    mock_create.side_effect = AssessmentError(
-        message="An unexpected error occurred",
-        details={"context": "session creation"}
-    )
-    
-    # Try to start a session
-    response = test_client.post(
-        "/api/start-session",
-        json={
-            "topic": "Python Programming",
-            "initial_difficulty": "Medium"
-        }
-    )
-    
-    # Validate error response structure
-    validate_error_response_structure(response.json())
+    # Validate error response structure, including the frozen timestamp
+    validate_error_response_structure(payload)
     
     # Check error type is correct
-    detail = response.json()["detail"]
-    assert detail["error_type"] == "AssessmentError", \
-        f"Expected error_type 'AssessmentError', got '{detail['error_type']}'"
-
-
-# ============================================================================
-# Tests for Unexpected Exceptions (500)
-# ============================================================================
-
-@patch("app.services.session_service.SessionService.create_session")
-def test_unexpected_exception_returns_500(mock_create, test_client):
-    """
-    Test that unexpected exceptions return 500 status code.
-    
-    Validates: Requirements 9.2
-    """
-    # Mock the session service to raise an unexpected exception
-    mock_create.side_effect = RuntimeError("Unexpected error")
-    
-    # Try to start a session
-    response = test_client.post(
-        "/api/start-session",
-        json={
-            "topic": "Python Programming",
-            "initial_difficulty": "Medium"
-        }
-    )
-    
-    # Should return 500 for unexpected error
-    assert response.status_code == 500, \
-        f"Unexpected exception should return 500, got {response.status_code}"
-
-
-@patch("app.services.session_service.SessionService.create_session")
-def test_unexpected_exception_has_correct_structure(mock_create, test_client):
-    """
-    Test that unexpected exception response has required structure.
-    
-    Validates: Requirements 9.2
-    """
-    # Mock the session service to raise an unexpected exception
-    mock_create.side_effect = RuntimeError("Unexpected error")
-    
-    # Try to start a session
-    response = test_client.post(
-        "/api/start-session",
-        json={
-            "topic": "Python Programming",
-            "initial_difficulty": "Medium"
-        }
-    )
-    
-    # Validate error response structure
-    validate_error_response_structure(response.json())
-    
-    # Check error type is InternalServerError for unexpected exceptions
-    detail = response.json()["detail"]
-    assert detail["error_type"] == "InternalServerError", \
-        f"Expected error_type 'InternalServerError', got '{detail['error_type']}'"
+    detail = payload["detail"]
+    assert detail["error_type"] == expected_error_type, \
+        f"Expected error_type '{expected_error_type}', got '{detail['error_type']}'"
+    assert _parse_iso(detail["timestamp"]) == _FROZEN_NOW
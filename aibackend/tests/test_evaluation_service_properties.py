@@ -10,7 +10,11 @@ This module tests that evaluation results:
 Validates: Requirements 2.3, 2.4
 """
 
-from hypothesis import given, strategies as st, settings
+import orjson
+import pytest
+
+from hypothesis import example, given, strategies as st, settings
+from pydantic import ValidationError
 
 from app.models import EvaluationResult, Difficulty
 
@@ -20,7 +24,9 @@ from app.models import EvaluationResult, Difficulty
 # ============================================================================
 
 valid_scores = st.integers(min_value=0, max_value=100)
-valid_feedback = st.text(min_size=1, max_size=500).filter(lambda s: s.strip() != "")
+# Feedback length is never the property under test, so keep strings short
+short_feedback = st.text(min_size=1, max_size=64).filter(lambda s: s.strip() != "")
+padded_feedback = short_feedback.map(lambda s: "  " + s + "  ")
 valid_difficulties = st.sampled_from([Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD])
 
 
@@ -28,12 +34,17 @@ valid_difficulties = st.sampled_from([Difficulty.EASY, Difficulty.MEDIUM, Diffic
 # Property Tests for Score Threshold
 # ============================================================================
 
-@settings(max_examples=50)
+# The 79/80/81 threshold boundaries are pinned with @example, so a few
+# generated examples are enough
+@settings(max_examples=15)
 @given(
     score=valid_scores,
-    feedback_text=valid_feedback,
+    feedback_text=short_feedback,
     suggested_difficulty=valid_difficulties
 )
+@example(score=79, feedback_text="Good answer", suggested_difficulty=Difficulty.MEDIUM)
+@example(score=80, feedback_text="Good answer", suggested_difficulty=Difficulty.MEDIUM)
+@example(score=81, feedback_text="Good answer", suggested_difficulty=Difficulty.MEDIUM)
 def test_score_threshold_determines_correctness(score, feedback_text, suggested_difficulty):
     """
     Property: For any evaluation result, the is_correct field should be true 
@@ -66,12 +77,15 @@ def test_score_threshold_determines_correctness(score, feedback_text, suggested_
             f"Score {score} < 80 should result in is_correct=False, but got {result.is_correct}"
 
 
-@settings(max_examples=50)
-@given(
-    feedback_text=valid_feedback,
-    suggested_difficulty=valid_difficulties
+@pytest.mark.parametrize(
+    "score,expected_is_correct",
+    [
+        pytest.param(79, False, id="just-below"),
+        pytest.param(80, True, id="at-threshold"),
+        pytest.param(81, True, id="just-above"),
+    ]
 )
-def test_score_threshold_boundary_at_80(feedback_text, suggested_difficulty):
+def test_score_threshold_boundary_at_80(score, expected_is_correct):
     """
     Property: The score threshold boundary at 80 should be inclusive - 
     a score of exactly 80 should result in is_correct=True.
@@ -79,49 +93,26 @@ def test_score_threshold_boundary_at_80(feedback_text, suggested_difficulty):
     Feature: ai-assessment-backend, Property 5: Score threshold determines correctness
     Validates: Requirements 2.3, 2.4
     """
-    # Test the exact boundary: score = 80
-    result_at_threshold = EvaluationResult(
-        score=80,
-        is_correct=True,
-        feedback_text=feedback_text,
-        suggested_difficulty=suggested_difficulty
-    )
-    
-    assert result_at_threshold.is_correct is True, \
-        "Score of exactly 80 should result in is_correct=True"
-    assert result_at_threshold.score == 80
-    
-    # Test just below the boundary: score = 79
-    result_below_threshold = EvaluationResult(
-        score=79,
-        is_correct=False,
-        feedback_text=feedback_text,
-        suggested_difficulty=suggested_difficulty
-    )
-    
-    assert result_below_threshold.is_correct is False, \
-        "Score of 79 should result in is_correct=False"
-    assert result_below_threshold.score == 79
-    
-    # Test just above the boundary: score = 81
-    result_above_threshold = EvaluationResult(
-        score=81,
-        is_correct=True,
-        feedback_text=feedback_text,
-        suggested_difficulty=suggested_difficulty
+    result = EvaluationResult(
+        score=score,
+        is_correct=expected_is_correct,
+        feedback_text="Good answer",
+        suggested_difficulty=Difficulty.MEDIUM
     )
     
-    assert result_above_threshold.is_correct is True, \
-        "Score of 81 should result in is_correct=True"
-    assert result_above_threshold.score == 81
+    assert result.is_correct is expected_is_correct, \
+        f"Score of {score} should result in is_correct={expected_is_correct}"
+    assert result.score == score
 
 
-@settings(max_examples=50)
+@settings(max_examples=15)
 @given(
     score=st.integers(min_value=80, max_value=100),
-    feedback_text=valid_feedback,
+    feedback_text=short_feedback,
     suggested_difficulty=valid_difficulties
 )
+@example(score=80, feedback_text="Good answer", suggested_difficulty=Difficulty.MEDIUM)
+@example(score=100, feedback_text="Good answer", suggested_difficulty=Difficulty.MEDIUM)
 def test_scores_above_threshold_are_correct(score, feedback_text, suggested_difficulty):
     """
     Property: For any score >= 80, is_correct must be True.
@@ -141,12 +132,14 @@ def test_scores_above_threshold_are_correct(score, feedback_text, suggested_diff
     assert result.score >= 80
 
 
-@settings(max_examples=50)
+@settings(max_examples=15)
 @given(
     score=st.integers(min_value=0, max_value=79),
-    feedback_text=valid_feedback,
+    feedback_text=short_feedback,
     suggested_difficulty=valid_difficulties
 )
+@example(score=0, feedback_text="Good answer", suggested_difficulty=Difficulty.MEDIUM)
+@example(score=79, feedback_text="Good answer", suggested_difficulty=Difficulty.MEDIUM)
 def test_scores_below_threshold_are_incorrect(score, feedback_text, suggested_difficulty):
     """
     Property: For any score < 80, is_correct must be False.
@@ -170,11 +163,11 @@ def test_scores_below_threshold_are_incorrect(score, feedback_text, suggested_di
 # Property Tests for Evaluation Response Completeness
 # ============================================================================
 
-@settings(max_examples=50)
+@settings(max_examples=15)
 @given(
     score=valid_scores,
     is_correct=st.booleans(),
-    feedback_text=valid_feedback,
+    feedback_text=short_feedback,
     suggested_difficulty=valid_difficulties
 )
 def test_evaluation_response_contains_all_required_fields(
@@ -215,11 +208,11 @@ def test_evaluation_response_contains_all_required_fields(
         f"suggested_difficulty must be a valid Difficulty value, got {result.suggested_difficulty}"
 
 
-@settings(max_examples=50)
+@settings(max_examples=15)
 @given(
     score=valid_scores,
     is_correct=st.booleans(),
-    feedback_text=valid_feedback,
+    feedback_text=short_feedback,
     suggested_difficulty=valid_difficulties
 )
 def test_evaluation_result_serialization_preserves_all_fields(
@@ -232,8 +225,8 @@ def test_evaluation_result_serialization_preserves_all_fields(
     Feature: ai-assessment-backend, Property 6: Evaluation responses contain all required fields
     Validates: Requirements 2.6
     """
-    # Create an EvaluationResult
-    original_result = EvaluationResult(
+    # Create an EvaluationResult, skipping validation
+    original_result = EvaluationResult.model_construct(
         score=score,
         is_correct=is_correct,
         feedback_text=feedback_text,
@@ -260,7 +253,7 @@ def test_evaluation_result_serialization_preserves_all_fields(
         f"suggested_difficulty mismatch: expected {original_result.suggested_difficulty.value}, got {result_dict['suggested_difficulty']}"
 
 
-@settings(max_examples=50)
+@settings(max_examples=15)
 @given(
     score=valid_scores,
     is_correct=st.booleans(),
@@ -273,9 +266,6 @@ def test_evaluation_result_rejects_empty_feedback(score, is_correct, suggested_d
     Feature: ai-assessment-backend, Property 6: Evaluation responses contain all required fields
     Validates: Requirements 2.6
     """
-    import pytest
-    from pydantic import ValidationError
-    
     # Test with empty string
     with pytest.raises(ValidationError) as exc_info:
         EvaluationResult(
@@ -295,15 +285,15 @@ def test_evaluation_result_rejects_empty_feedback(score, is_correct, suggested_d
 # Property Tests for Response Parsing
 # ============================================================================
 
-@settings(max_examples=50)
+@settings(max_examples=15)
 @given(
     score=valid_scores,
     is_correct=st.booleans(),
-    feedback_text=valid_feedback,
+    feedback_text=short_feedback,
     suggested_difficulty=valid_difficulties
 )
 def test_evaluation_response_parsing_preserves_data(
-    score, is_correct, feedback_text, suggested_difficulty
+    evaluation_service, score, is_correct, feedback_text, suggested_difficulty
 ):
     """
     Property: For any valid GPT-4o JSON response containing evaluation fields,
@@ -312,20 +302,6 @@ def test_evaluation_response_parsing_preserves_data(
     Feature: ai-assessment-backend, Property 7: Evaluation response parsing preserves data
     Validates: Requirements 2.2
     """
-    import json
-    from app.services.evaluation_service import EvaluationService
-    from app.clients.openai_client import OpenAIClient
-    from config.settings import Settings
-    
-    # Create a mock settings object (we won't actually call the API)
-    settings = Settings(
-        openai_api_key="test-key",
-        tts_api_key="test-key",
-        gpt_model="gpt-4o"
-    )
-    openai_client = OpenAIClient(settings)
-    evaluation_service = EvaluationService(openai_client)
-    
     # Create a valid JSON response with the generated values
     response_json = {
         "score": score,
@@ -335,7 +311,7 @@ def test_evaluation_response_parsing_preserves_data(
     }
     
     # Convert to JSON string
-    response_text = json.dumps(response_json)
+    response_text = orjson.dumps(response_json).decode()
     
     # Parse the response using the service's parsing method
     parsed_result = evaluation_service._parse_evaluation_response(response_text)
@@ -355,15 +331,15 @@ def test_evaluation_response_parsing_preserves_data(
         f"Parsed result should be EvaluationResult, got {type(parsed_result)}"
 
 
-@settings(max_examples=50)
+@settings(max_examples=15)
 @given(
     score=valid_scores,
     is_correct=st.booleans(),
-    feedback_text=valid_feedback,
+    feedback_text=short_feedback,
     suggested_difficulty=valid_difficulties
 )
 def test_evaluation_response_parsing_round_trip(
-    score, is_correct, feedback_text, suggested_difficulty
+    evaluation_service, score, is_correct, feedback_text, suggested_difficulty
 ):
     """
     Property: For any evaluation result, converting to JSON and parsing back
@@ -373,11 +349,6 @@ def test_evaluation_response_parsing_round_trip(
     Feature: ai-assessment-backend, Property 7: Evaluation response parsing preserves data
     Validates: Requirements 2.2
     """
-    import json
-    from app.services.evaluation_service import EvaluationService
-    from app.clients.openai_client import OpenAIClient
-    from config.settings import Settings
-    
     # Create original evaluation result
     original_result = EvaluationResult(
         score=score,
@@ -393,17 +364,9 @@ def test_evaluation_response_parsing_round_trip(
         "feedback_text": original_result.feedback_text,
         "suggested_difficulty": original_result.suggested_difficulty.value
     }
-    response_text = json.dumps(response_json)
+    response_text = orjson.dumps(response_json).decode()
     
     # Parse back using the service
-    settings = Settings(
-        openai_api_key="test-key",
-        tts_api_key="test-key",
-        gpt_model="gpt-4o"
-    )
-    openai_client = OpenAIClient(settings)
-    evaluation_service = EvaluationService(openai_client)
-    
     parsed_result = evaluation_service._parse_evaluation_response(response_text)
     
     # Verify round-trip consistency
@@ -418,15 +381,15 @@ def test_evaluation_response_parsing_round_trip(
         "Round-trip failed: suggested_difficulty mismatch"
 
 
-@settings(max_examples=50)
+@settings(max_examples=15)
 @given(
     score=valid_scores,
     is_correct=st.booleans(),
-    feedback_text=st.text(min_size=1, max_size=500).filter(lambda s: s.strip() != "").map(lambda s: "  " + s + "  "),  # Add whitespace
+    feedback_text=padded_feedback,
     suggested_difficulty=valid_difficulties
 )
 def test_evaluation_response_parsing_handles_whitespace(
-    score, is_correct, feedback_text, suggested_difficulty
+    evaluation_service, score, is_correct, feedback_text, suggested_difficulty
 ):
     """
     Property: For any evaluation response with whitespace in feedback_text,
@@ -435,11 +398,6 @@ def test_evaluation_response_parsing_handles_whitespace(
     Feature: ai-assessment-backend, Property 7: Evaluation response parsing preserves data
     Validates: Requirements 2.2
     """
-    import json
-    from app.services.evaluation_service import EvaluationService
-    from app.clients.openai_client import OpenAIClient
-    from config.settings import Settings
-    
     # Create a JSON response with whitespace in feedback
     response_json = {
         "score": score,
@@ -447,17 +405,9 @@ def test_evaluation_response_parsing_handles_whitespace(
         "feedback_text": feedback_text,
         "suggested_difficulty": suggested_difficulty.value
     }
-    response_text = json.dumps(response_json)
+    response_text = orjson.dumps(response_json).decode()
     
     # Parse the response
-    settings = Settings(
-        openai_api_key="test-key",
-        tts_api_key="test-key",
-        gpt_model="gpt-4o"
-    )
-    openai_client = OpenAIClient(settings)
-    evaluation_service = EvaluationService(openai_client)
-    
     parsed_result = evaluation_service._parse_evaluation_response(response_text)
     
     # Verify whitespace is trimmed
@@ -7,192 +7,234 @@ Requirements: 2.1, 2.5
 """
 
 import pytest
-import json
-from unittest.mock import Mock, patch
+import orjson
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 from app.services.evaluation_service import EvaluationService
-from app.clients.openai_client import OpenAIClient
 from app.models import EvaluationResult, Difficulty
 from app.exceptions import EvaluationError, OpenAIAPIError
-from config.settings import Settings
+from tests._helpers import Recorder
 
 
-@pytest.fixture
+# ============================================================================
+# Canned GPT-4o responses, encoded once
+# ============================================================================
+
+RESP_HIGH_SCORE = orjson.dumps({
+    "score": 95,
+    "is_correct": True,
+    "feedback_text": "Excellent answer! You demonstrated a thorough understanding of the topic.",
+    "suggested_difficulty": "Hard"
+}).decode()
+
+RESP_AT_THRESHOLD = orjson.dumps({
+    "score": 80,
+    "is_correct": True,
+    "feedback_text": "Good answer. You covered the main points.",
+    "suggested_difficulty": "Medium"
+}).decode()
+
+RESP_SUGGESTS_HARD = orjson.dumps({
+    "score": 92,
+    "is_correct": True,
+    "feedback_text": "Outstanding answer with excellent detail.",
+    "suggested_difficulty": "Hard"
+}).decode()
+
+RESP_LOW_SCORE = orjson.dumps({
+    "score": 45,
+    "is_correct": False,
+    "feedback_text": "Your answer is partially correct but misses key concepts. "
+                   "Review the relationship between energy and matter.",
+    "suggested_difficulty": "Easy"
+}).decode()
+
+RESP_BELOW_THRESHOLD = orjson.dumps({
+    "score": 79,
+    "is_correct": False,
+    "feedback_text": "Close! You have the right idea but need more detail.",
+    "suggested_difficulty": "Medium"
+}).decode()
+
+RESP_ZERO_SCORE = orjson.dumps({
+    "score": 0,
+    "is_correct": False,
+    "feedback_text": "This answer is incorrect. Please review the fundamental concepts.",
+    "suggested_difficulty": "Easy"
+}).decode()
+
+RESP_SUGGESTS_EASY = orjson.dumps({
+    "score": 50,
+    "is_correct": False,
+    "feedback_text": "Needs improvement. Review the basics.",
+    "suggested_difficulty": "Easy"
+}).decode()
+
+RESP_MISSING_FEEDBACK = orjson.dumps({
+    "score": 85,
+    "is_correct": True,
+    "suggested_difficulty": "Medium"
+    # Missing feedback_text
+}).decode()
+
+RESP_SCORE_OUT_OF_RANGE = orjson.dumps({
+    "score": 150,  # Invalid: > 100
+    "is_correct": True,
+    "feedback_text": "Good answer",
+    "suggested_difficulty": "Medium"
+}).decode()
+
+RESP_INVALID_DIFFICULTY = orjson.dumps({
+    "score": 85,
+    "is_correct": True,
+    "feedback_text": "Good answer",
+    "suggested_difficulty": "VeryHard"  # Invalid difficulty
+}).decode()
+
+RESP_EMPTY_FEEDBACK = orjson.dumps({
+    "score": 85,
+    "is_correct": True,
+    "feedback_text": "",  # Empty feedback
+    "suggested_difficulty": "Medium"
+}).decode()
+
+RESP_EASY = orjson.dumps({
+    "score": 60,
+    "is_correct": False,
+    "feedback_text": "Needs improvement",
+    "suggested_difficulty": "Easy"
+}).decode()
+
+RESP_MEDIUM = orjson.dumps({
+    "score": 75,
+    "is_correct": False,
+    "feedback_text": "Good effort",
+    "suggested_difficulty": "Medium"
+}).decode()
+
+RESP_HARD = orjson.dumps({
+    "score": 95,
+    "is_correct": True,
+    "feedback_text": "Excellent",
+    "suggested_difficulty": "Hard"
+}).decode()
+
+# Parsed forms of RESP_EASY / RESP_MEDIUM / RESP_HARD, built once at import
+EXPECTED_EASY = EvaluationResult(
+    score=60, is_correct=False, feedback_text="Needs improvement", suggested_difficulty=Difficulty.EASY
+)
+EXPECTED_MEDIUM = EvaluationResult(
+    score=75, is_correct=False, feedback_text="Good effort", suggested_difficulty=Difficulty.MEDIUM
+)
+EXPECTED_HARD = EvaluationResult(
+    score=95, is_correct=True, feedback_text="Excellent", suggested_difficulty=Difficulty.HARD
+)
+
+RESP_PADDED_FEEDBACK = orjson.dumps({
+    "score": 85,
+    "is_correct": True,
+    "feedback_text": "  Good answer with whitespace  ",
+    "suggested_difficulty": "Medium"
+}).decode()
+
+
+class _StubClient:
+    """Minimal OpenAI client stand-in exposing only what EvaluationService calls"""
+    
+    def __init__(self, settings):
+        self.settings = settings
+        self.chat_completion = MagicMock()
+
+
+def _raiser(error):
+    """Build a side_effect function that raises error when called"""
+    def _raise(*args, **kwargs):
+        raise error
+    return _raise
+
+
+@pytest.fixture(scope="module")
 def mock_settings():
-    """Create mock settings for testing"""
-    settings = Mock(spec=Settings)
-    settings.openai_api_key = "test-api-key-123"
-    settings.gpt_model = "gpt-4o"
-    return settings
+    """Create stub settings shared by the module"""
+    return SimpleNamespace(openai_api_key="test-api-key-123", gpt_model="gpt-4o")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_openai_client(mock_settings):
-    """Create a mock OpenAI client"""
-    client = Mock(spec=OpenAIClient)
-    client.settings = mock_settings
-    return client
+    """Create a stub OpenAI client shared by the module"""
+    return _StubClient(mock_settings)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def evaluation_service(mock_openai_client):
     """Create evaluation service with mocked OpenAI client"""
     return EvaluationService(mock_openai_client)
 
 
-class TestEvaluationServiceCorrectAnswers:
-    """Test suite for evaluating correct answers"""
-    
-    def test_evaluate_correct_answer_high_score(self, evaluation_service, mock_openai_client):
-        """
-        Test evaluation of a correct answer with high score (>= 80).
-        
-        Requirements: 2.1
-        """
-        # Mock GPT-4o response for a correct answer
-        gpt_response = {
-            "score": 95,
-            "is_correct": True,
-            "feedback_text": "Excellent answer! You demonstrated a thorough understanding of the topic.",
-            "suggested_difficulty": "Hard"
-        }
-        mock_openai_client.chat_completion.return_value = json.dumps(gpt_response)
-        
-        # Evaluate an answer
-        result = evaluation_service.evaluate_answer(
-            question="What is photosynthesis?",
-            answer="Photosynthesis is the process by which plants convert light energy into chemical energy.",
-            topic="Biology"
-        )
-        
-        # Verify the result
-        assert isinstance(result, EvaluationResult)
-        assert result.score == 95
-        assert result.is_correct is True
-        assert "Excellent" in result.feedback_text
-        assert result.suggested_difficulty == Difficulty.HARD
-        
-        # Verify OpenAI client was called correctly
-        mock_openai_client.chat_completion.assert_called_once()
-        call_args = mock_openai_client.chat_completion.call_args
-        
-        # Verify messages structure
-        messages = call_args[1]["messages"]
-        assert len(messages) == 2
-        assert messages[0]["role"] == "system"
-        assert "expert educator" in messages[0]["content"].lower()
-        assert messages[1]["role"] == "user"
-        
-        # Verify prompt contains question, answer, and topic
-        prompt = messages[1]["content"]
-        assert "photosynthesis" in prompt.lower()
-        assert "Biology" in prompt
-        
-        # Verify JSON response format was requested
-        assert call_args[1]["response_format"] == "json"
-        assert call_args[1]["temperature"] == 0.3
-    
-    def test_evaluate_correct_answer_at_threshold(self, evaluation_service, mock_openai_client):
-        """
-        Test evaluation of a correct answer at the threshold (score = 80).
-        
-        Requirements: 2.1
-        """
-        # Mock GPT-4o response for answer at threshold
-        gpt_response = {
-            "score": 80,
-            "is_correct": True,
-            "feedback_text": "Good answer. You covered the main points.",
-            "suggested_difficulty": "Medium"
-        }
-        mock_openai_client.chat_completion.return_value = json.dumps(gpt_response)
-        
-        # Evaluate an answer
-        result = evaluation_service.evaluate_answer(
-            question="Explain Newton's first law",
-            answer="An object at rest stays at rest unless acted upon by a force.",
-            topic="Physics"
-        )
-        
-        # Verify the result
-        assert result.score == 80
-        assert result.is_correct is True
-        assert result.suggested_difficulty == Difficulty.MEDIUM
-    
-    def test_evaluate_correct_answer_suggests_hard(self, evaluation_service, mock_openai_client):
-        """
-        Test that high-scoring answers suggest Hard difficulty.
-        
-        Requirements: 2.1
-        """
-        # Mock GPT-4o response with score >= 90
-        gpt_response = {
-            "score": 92,
-            "is_correct": True,
-            "feedback_text": "Outstanding answer with excellent detail.",
-            "suggested_difficulty": "Hard"
-        }
-        mock_openai_client.chat_completion.return_value = json.dumps(gpt_response)
-        
-        # Evaluate an answer
-        result = evaluation_service.evaluate_answer(
-            question="Test question",
-            answer="Test answer",
-            topic="Test topic"
-        )
-        
-        # Verify Hard difficulty is suggested
-        assert result.score >= 90
-        assert result.suggested_difficulty == Difficulty.HARD
+@pytest.fixture(scope="module")
+def canonical_prompt(evaluation_service):
+    """Build the evaluation prompt once for a canonical question and answer"""
+    return evaluation_service._build_evaluation_prompt(
+        question="What is the capital of France?",
+        answer="Paris",
+        topic="Geography"
+    )
 
 
-class TestEvaluationServiceIncorrectAnswers:
-    """Test suite for evaluating incorrect answers"""
-    
-    def test_evaluate_incorrect_answer_low_score(self, evaluation_service, mock_openai_client):
-        """
-        Test evaluation of an incorrect answer with low score (< 80).
-        
-        Requirements: 2.1
-        """
-        # Mock GPT-4o response for an incorrect answer
-        gpt_response = {
-            "score": 45,
-            "is_correct": False,
-            "feedback_text": "Your answer is partially correct but misses key concepts. "
-                           "Review the relationship between energy and matter.",
-            "suggested_difficulty": "Easy"
-        }
-        mock_openai_client.chat_completion.return_value = json.dumps(gpt_response)
-        
-        # Evaluate an answer
-        result = evaluation_service.evaluate_answer(
-            question="What is E=mc²?",
-            answer="It's about energy",
-            topic="Physics"
-        )
-        
-        # Verify the result
-        assert isinstance(result, EvaluationResult)
-        assert result.score == 45
-        assert result.is_correct is False
-        assert "partially correct" in result.feedback_text.lower()
-        assert result.suggested_difficulty == Difficulty.EASY
+@pytest.fixture(autouse=True)
+def _reset_openai_client(mock_openai_client):
+    """Clear recorded calls and configured responses before each test"""
+    mock_openai_client.chat_completion.reset_mock(return_value=True, side_effect=True)
+
+
+# (canned response, score, is_correct, suggested difficulty, feedback substring)
+SCORING_CASES = [
+    pytest.param(RESP_HIGH_SCORE, 95, True, Difficulty.HARD, "Excellent", id="high-score"),
+    pytest.param(RESP_AT_THRESHOLD, 80, True, Difficulty.MEDIUM, "Good answer", id="at-threshold"),
+    pytest.param(RESP_SUGGESTS_HARD, 92, True, Difficulty.HARD, "Outstanding", id="suggests-hard"),
+    pytest.param(RESP_LOW_SCORE, 45, False, Difficulty.EASY, "partially correct", id="low-score"),
+    pytest.param(RESP_BELOW_THRESHOLD, 79, False, Difficulty.MEDIUM, "Close!", id="just-below-threshold"),
+    pytest.param(RESP_ZERO_SCORE, 0, False, Difficulty.EASY, "incorrect", id="zero-score"),
+    pytest.param(RESP_SUGGESTS_EASY, 50, False, Difficulty.EASY, "Needs improvement", id="suggests-easy"),
+]
+
+
+# (chat_completion attribute to set, its value, expected message pattern)
+ERROR_CASES = [
+    pytest.param("return_value", "This is not valid JSON", r"(?i)failed to parse|json", id="invalid-json"),
+    pytest.param("return_value", RESP_MISSING_FEEDBACK, r"(?i)missing required fields.*feedback_text", id="missing-fields"),
+    pytest.param("return_value", RESP_SCORE_OUT_OF_RANGE, r"(?i)invalid score", id="score-out-of-range"),
+    pytest.param("return_value", RESP_INVALID_DIFFICULTY, r"(?i)invalid suggested_difficulty", id="invalid-difficulty"),
+    pytest.param("return_value", RESP_EMPTY_FEEDBACK, r"(?i)feedback_text", id="empty-feedback"),
+    pytest.param("side_effect", _raiser(ValueError("Unexpected error")), r"(?i)unexpected error", id="unexpected-exception"),
+]
+
+
+class TestEvaluationServiceScoring:
+    """Test suite for evaluating correct and incorrect answers"""
     
-    def test_evaluate_incorrect_answer_just_below_threshold(self, evaluation_service, mock_openai_client):
-        """
-        Test evaluation of an answer just below the threshold (score = 79).
+    @pytest.mark.parametrize(
+        "response,score,is_correct,suggested_difficulty,feedback_substr",
+        SCORING_CASES
+    )
+    def test_evaluate_answer_result(
+        self,
+        evaluation_service,
+        mock_openai_client,
+        response,
+        score,
+        is_correct,
+        suggested_difficulty,
+        feedback_substr
+    ):
+        """
+        Test evaluation of answers on both sides of the 80-point threshold.
         
         Requirements: 2.1
         """
-        # Mock GPT-4o response for answer just below threshold
-        gpt_response = {
-            "score": 79,
-            "is_correct": False,
-            "feedback_text": "Close! You have the right idea but need more detail.",
-            "suggested_difficulty": "Medium"
-        }
-        mock_openai_client.chat_completion.return_value = json.dumps(gpt_response)
+        # Mock GPT-4o response for this case
+        mock_openai_client.chat_completion.return_value = response
         
         # Evaluate an answer
         result = evaluation_service.evaluate_answer(
@@ -202,62 +244,50 @@ class TestEvaluationServiceIncorrectAnswers:
         )
         
         # Verify the result
-        assert result.score == 79
-        assert result.is_correct is False
-        assert result.suggested_difficulty == Difficulty.MEDIUM
+        assert isinstance(result, EvaluationResult)
+        assert result.score == score
+        assert result.is_correct is is_correct
+        assert feedback_substr.lower() in result.feedback_text.lower()
+        assert result.suggested_difficulty == suggested_difficulty
     
-    def test_evaluate_incorrect_answer_zero_score(self, evaluation_service, mock_openai_client):
+    def test_evaluate_answer_sends_expected_request(
+        self, evaluation_service, mock_openai_client, monkeypatch
+    ):
         """
-        Test evaluation of a completely incorrect answer (score = 0).
+        Test that evaluation sends the expected prompt and options to GPT-4o.
         
         Requirements: 2.1
         """
-        # Mock GPT-4o response for completely incorrect answer
-        gpt_response = {
-            "score": 0,
-            "is_correct": False,
-            "feedback_text": "This answer is incorrect. Please review the fundamental concepts.",
-            "suggested_difficulty": "Easy"
-        }
-        mock_openai_client.chat_completion.return_value = json.dumps(gpt_response)
+        # Record request kwargs with a plain callable instead of the MagicMock
+        recorder = Recorder(ret=RESP_HIGH_SCORE)
+        monkeypatch.setattr(mock_openai_client, "chat_completion", recorder)
         
         # Evaluate an answer
-        result = evaluation_service.evaluate_answer(
-            question="What is 2+2?",
-            answer="5",
-            topic="Mathematics"
+        evaluation_service.evaluate_answer(
+            question="What is photosynthesis?",
+            answer="Photosynthesis is the process by which plants convert light energy into chemical energy.",
+            topic="Biology"
         )
         
-        # Verify the result
-        assert result.score == 0
-        assert result.is_correct is False
-        assert result.suggested_difficulty == Difficulty.EASY
-    
-    def test_evaluate_incorrect_answer_suggests_easy(self, evaluation_service, mock_openai_client):
-        """
-        Test that low-scoring answers suggest Easy difficulty.
+        # Verify OpenAI client was called correctly
+        assert len(recorder.calls) == 1
+        request = recorder.calls[0]
         
-        Requirements: 2.1
-        """
-        # Mock GPT-4o response with score < 70
-        gpt_response = {
-            "score": 50,
-            "is_correct": False,
-            "feedback_text": "Needs improvement. Review the basics.",
-            "suggested_difficulty": "Easy"
-        }
-        mock_openai_client.chat_completion.return_value = json.dumps(gpt_response)
+        # Verify messages structure
+        messages = request["messages"]
+        assert len(messages) == 2
+        assert messages[0]["role"] == "system"
+        assert "expert educator" in messages[0]["content"].lower()
+        assert messages[1]["role"] == "user"
         
-        # Evaluate an answer
-        result = evaluation_service.evaluate_answer(
-            question="Test question",
-            answer="Test answer",
-            topic="Test topic"
-        )
+        # Verify prompt contains question, answer, and topic
+        prompt = messages[1]["content"]
+        assert "photosynthesis" in prompt.lower()
+        assert "Biology" in prompt
         
-        # Verify Easy difficulty is suggested
-        assert result.score < 70
-        assert result.suggested_difficulty == Difficulty.EASY
+        # Verify JSON response format was requested
+        assert request["response_format"] == "json"
+        assert request["temperature"] == 0.3
 
 
 class TestEvaluationServiceAPIErrorHandling:
@@ -274,10 +304,10 @@ class TestEvaluationServiceAPIErrorHandling:
             message="API rate limit exceeded",
             operation="chat_completion"
         )
-        mock_openai_client.chat_completion.side_effect = original_error
+        mock_openai_client.chat_completion.side_effect = _raiser(original_error)
         
         # Attempt to evaluate and expect EvaluationError
-        with pytest.raises(EvaluationError) as exc_info:
+        with pytest.raises(EvaluationError, match=r"(?i)failed to evaluate answer") as exc_info:
             evaluation_service.evaluate_answer(
                 question="Test question",
                 answer="Test answer",
@@ -285,174 +315,43 @@ class TestEvaluationServiceAPIErrorHandling:
             )
         
         # Verify error details
-        assert "failed to evaluate answer" in str(exc_info.value).lower()
         assert exc_info.value.details is not None
         # The original_error is stored as a string in details dict
         assert "original_error" in exc_info.value.details
         # But also as an attribute on the exception
         assert isinstance(exc_info.value.original_error, OpenAIAPIError)
     
-    def test_invalid_json_response_error(self, evaluation_service, mock_openai_client):
-        """
-        Test handling of invalid JSON response from GPT-4o.
-        
-        Requirements: 2.5
-        """
-        # Mock invalid JSON response
-        mock_openai_client.chat_completion.return_value = "This is not valid JSON"
-        
-        # Attempt to evaluate and expect EvaluationError
-        with pytest.raises(EvaluationError) as exc_info:
-            evaluation_service.evaluate_answer(
-                question="Test question",
-                answer="Test answer",
-                topic="Test topic"
-            )
-        
-        # Verify error details
-        assert "failed to parse" in str(exc_info.value).lower() or "json" in str(exc_info.value).lower()
-    
-    def test_missing_required_fields_error(self, evaluation_service, mock_openai_client):
+    @pytest.mark.parametrize("attribute, value, match", ERROR_CASES)
+    def test_evaluate_answer_error(
+        self, evaluation_service, mock_openai_client, attribute, value, match
+    ):
         """
-        Test handling of response missing required fields.
+        Test that bad GPT-4o output or unexpected failures raise EvaluationError.
         
         Requirements: 2.5
         """
-        # Mock response missing feedback_text field
-        incomplete_response = {
-            "score": 85,
-            "is_correct": True,
-            "suggested_difficulty": "Medium"
-            # Missing feedback_text
-        }
-        mock_openai_client.chat_completion.return_value = json.dumps(incomplete_response)
+        # Configure the mocked chat_completion for this scenario
+        setattr(mock_openai_client.chat_completion, attribute, value)
         
-        # Attempt to evaluate and expect EvaluationError
-        with pytest.raises(EvaluationError) as exc_info:
+        # Attempt to evaluate and expect EvaluationError with a matching message
+        with pytest.raises(EvaluationError, match=match):
             evaluation_service.evaluate_answer(
                 question="Test question",
                 answer="Test answer",
                 topic="Test topic"
             )
-        
-        # Verify error mentions missing fields
-        assert "missing required fields" in str(exc_info.value).lower()
-        assert "feedback_text" in str(exc_info.value).lower()
-    
-    def test_invalid_score_value_error(self, evaluation_service, mock_openai_client):
-        """
-        Test handling of invalid score value (out of range).
-        
-        Requirements: 2.5
-        """
-        # Mock response with invalid score
-        invalid_response = {
-            "score": 150,  # Invalid: > 100
-            "is_correct": True,
-            "feedback_text": "Good answer",
-            "suggested_difficulty": "Medium"
-        }
-        mock_openai_client.chat_completion.return_value = json.dumps(invalid_response)
-        
-        # Attempt to evaluate and expect EvaluationError
-        with pytest.raises(EvaluationError) as exc_info:
-            evaluation_service.evaluate_answer(
-                question="Test question",
-                answer="Test answer",
-                topic="Test topic"
-            )
-        
-        # Verify error mentions invalid score
-        assert "invalid score" in str(exc_info.value).lower()
-    
-    def test_invalid_difficulty_value_error(self, evaluation_service, mock_openai_client):
-        """
-        Test handling of invalid difficulty value.
-        
-        Requirements: 2.5
-        """
-        # Mock response with invalid difficulty
-        invalid_response = {
-            "score": 85,
-            "is_correct": True,
-            "feedback_text": "Good answer",
-            "suggested_difficulty": "VeryHard"  # Invalid difficulty
-        }
-        mock_openai_client.chat_completion.return_value = json.dumps(invalid_response)
-        
-        # Attempt to evaluate and expect EvaluationError
-        with pytest.raises(EvaluationError) as exc_info:
-            evaluation_service.evaluate_answer(
-                question="Test question",
-                answer="Test answer",
-                topic="Test topic"
-            )
-        
-        # Verify error mentions invalid difficulty
-        assert "invalid suggested_difficulty" in str(exc_info.value).lower()
-    
-    def test_empty_feedback_text_error(self, evaluation_service, mock_openai_client):
-        """
-        Test handling of empty feedback text.
-        
-        Requirements: 2.5
-        """
-        # Mock response with empty feedback
-        invalid_response = {
-            "score": 85,
-            "is_correct": True,
-            "feedback_text": "",  # Empty feedback
-            "suggested_difficulty": "Medium"
-        }
-        mock_openai_client.chat_completion.return_value = json.dumps(invalid_response)
-        
-        # Attempt to evaluate and expect EvaluationError
-        with pytest.raises(EvaluationError) as exc_info:
-            evaluation_service.evaluate_answer(
-                question="Test question",
-                answer="Test answer",
-                topic="Test topic"
-            )
-        
-        # Verify error mentions feedback_text
-        assert "feedback_text" in str(exc_info.value).lower()
-    
-    def test_unexpected_exception_handling(self, evaluation_service, mock_openai_client):
-        """
-        Test handling of unexpected exceptions during evaluation.
-        
-        Requirements: 2.5
-        """
-        # Mock unexpected exception
-        mock_openai_client.chat_completion.side_effect = ValueError("Unexpected error")
-        
-        # Attempt to evaluate and expect EvaluationError
-        with pytest.raises(EvaluationError) as exc_info:
-            evaluation_service.evaluate_answer(
-                question="Test question",
-                answer="Test answer",
-                topic="Test topic"
-            )
-        
-        # Verify error is wrapped in EvaluationError
-        assert "unexpected error" in str(exc_info.value).lower()
 
 
 class TestEvaluationServicePromptBuilding:
     """Test suite for evaluation prompt building"""
     
-    def test_prompt_contains_all_required_elements(self, evaluation_service):
+    def test_prompt_contains_all_required_elements(self, canonical_prompt):
         """
         Test that the evaluation prompt contains all required elements.
         
         Requirements: 2.1
         """
-        # Build a prompt
-        prompt = evaluation_service._build_evaluation_prompt(
-            question="What is the capital of France?",
-            answer="Paris",
-            topic="Geography"
-        )
+        prompt = canonical_prompt
         
         # Verify prompt contains all required elements
         assert "Geography" in prompt
@@ -463,18 +362,13 @@ class TestEvaluationServicePromptBuilding:
         assert "json" in prompt.lower()
         assert "0-100" in prompt or "0 to 100" in prompt or "0 - 100" in prompt
     
-    def test_prompt_includes_difficulty_guidance(self, evaluation_service):
+    def test_prompt_includes_difficulty_guidance(self, canonical_prompt):
         """
         Test that the prompt includes guidance for suggesting difficulty.
         
         Requirements: 2.1
         """
-        # Build a prompt
-        prompt = evaluation_service._build_evaluation_prompt(
-            question="Test question",
-            answer="Test answer",
-            topic="Test topic"
-        )
+        prompt = canonical_prompt
         
         # Verify prompt includes difficulty guidance
         assert "Easy" in prompt
@@ -492,35 +386,10 @@ class TestEvaluationServiceResponseParsing:
         
         Requirements: 2.1
         """
-        # Test Easy difficulty
-        easy_response = json.dumps({
-            "score": 60,
-            "is_correct": False,
-            "feedback_text": "Needs improvement",
-            "suggested_difficulty": "Easy"
-        })
-        easy_result = evaluation_service._parse_evaluation_response(easy_response)
-        assert easy_result.suggested_difficulty == Difficulty.EASY
-        
-        # Test Medium difficulty
-        medium_response = json.dumps({
-            "score": 75,
-            "is_correct": False,
-            "feedback_text": "Good effort",
-            "suggested_difficulty": "Medium"
-        })
-        medium_result = evaluation_service._parse_evaluation_response(medium_response)
-        assert medium_result.suggested_difficulty == Difficulty.MEDIUM
-        
-        # Test Hard difficulty
-        hard_response = json.dumps({
-            "score": 95,
-            "is_correct": True,
-            "feedback_text": "Excellent",
-            "suggested_difficulty": "Hard"
-        })
-        hard_result = evaluation_service._parse_evaluation_response(hard_response)
-        assert hard_result.suggested_difficulty == Difficulty.HARD
+        # Each canned payload parses to its precomputed result
+        assert evaluation_service._parse_evaluation_response(RESP_EASY) == EXPECTED_EASY
+        assert evaluation_service._parse_evaluation_response(RESP_MEDIUM) == EXPECTED_MEDIUM
+        assert evaluation_service._parse_evaluation_response(RESP_HARD) == EXPECTED_HARD
     
     def test_parse_response_trims_whitespace(self, evaluation_service):
         """
@@ -528,15 +397,7 @@ class TestEvaluationServiceResponseParsing:
         
         Requirements: 2.1
         """
-        # Response with whitespace in feedback
-        response = json.dumps({
-            "score": 85,
-            "is_correct": True,
-            "feedback_text": "  Good answer with whitespace  ",
-            "suggested_difficulty": "Medium"
-        })
-        
-        result = evaluation_service._parse_evaluation_response(response)
+        result = evaluation_service._parse_evaluation_response(RESP_PADDED_FEEDBACK)
         
         # Verify whitespace is trimmed
         assert result.feedback_text == "Good answer with whitespace"
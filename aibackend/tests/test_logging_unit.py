@@ -11,6 +11,8 @@ import os
 import pytest
 import logging
 import json
+import orjson
+from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
 from fastapi import FastAPI, Request, Response
 from fastapi.testclient import TestClient
@@ -46,9 +48,47 @@ def reset_logging():
         root_logger.removeHandler(handler)
 
 
+class _ListHandler(logging.Handler):
+    """Handler that keeps each formatted record as a parsed dict"""
+    
+    def __init__(self, records):
+        super().__init__()
+        self.records = records
+        self.setFormatter(StructuredFormatter())
+    
+    def emit(self, record):
+        self.records.append(orjson.loads(self.format(record)))
+
+
 @pytest.fixture
+def log_records(reset_logging):
+    """
+    Collect structured log records emitted during a test.
+    
+    Installs a list-backed handler on a freshly reset root logger at DEBUG,
+    so tests assert on parsed fields instead of scanning captured stdout.
+    """
+    records = []
+    root_logger = logging.getLogger()
+    previous_level = root_logger.level
+    handler = _ListHandler(records)
+    root_logger.addHandler(handler)
+    root_logger.setLevel(logging.DEBUG)
+    
+    yield records
+    
+    root_logger.removeHandler(handler)
+    root_logger.setLevel(previous_level)
+
+
+def _record(log_records, message):
+    """Return the first collected record with the given message"""
+    return next(r for r in log_records if r["message"] == message)
+
+
+@pytest.fixture(scope="module")
 def test_app():
-    """Create a test FastAPI app with logging middleware"""
+    """Create a test FastAPI app with logging middleware, shared by the module"""
     app = FastAPI()
     
     # Add logging middleware
@@ -66,10 +106,10 @@ def test_app():
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_client(test_app):
-    """Create test client"""
-    return TestClient(test_app)
+    """Create a module-wide test client that returns 500s instead of raising"""
+    return TestClient(test_app, raise_server_exceptions=False)
 
 
 # ============================================================================
@@ -107,6 +147,27 @@ class TestStructuredFormatter:
         assert log_data["logger"] == "test"
         assert log_data["message"] == "Test message"
     
+    def test_timestamp_is_parseable_utc_offset(self, reset_logging):
+        """Test the timestamp keeps the +00:00 offset that fromisoformat accepts"""
+        formatter = StructuredFormatter()
+        logger = logging.getLogger("test")
+        
+        record = logger.makeRecord(
+            "test",
+            logging.INFO,
+            "test.py",
+            10,
+            "Test message",
+            (),
+            None
+        )
+        
+        timestamp = json.loads(formatter.format(record))["timestamp"]
+        
+        # Verify the offset format and that it parses on Python 3.10
+        assert timestamp.endswith("+00:00")
+        assert datetime.fromisoformat(timestamp).utcoffset() == timedelta(0)
+    
     def test_format_log_with_exception(self, reset_logging):
         """Test formatting a log record with exception info"""
         formatter = StructuredFormatter()
@@ -198,91 +259,67 @@ class TestLoggingConfiguration:
 class TestRequestLoggingMiddleware:
     """Test suite for request logging middleware"""
     
-    def test_request_logging_success(self, test_client, reset_logging, capsys):
+    def test_request_logging_success(self, test_client, log_records):
         """Test that successful requests are logged with details"""
-        # Configure logging to capture logs
-        configure_logging("INFO")
-        
         # Make request
         response = test_client.get("/test")
         
         # Verify response
         assert response.status_code == 200
         
-        # Capture stdout
-        captured = capsys.readouterr()
-        
         # Verify logs contain request details
-        assert "Request started" in captured.out
-        assert "GET /test" in captured.out
-        assert "Request completed" in captured.out
+        started = _record(log_records, "Request started: GET /test")
+        assert started["method"] == "GET"
+        assert started["path"] == "/test"
+        assert _record(log_records, "Request completed: GET /test")
     
-    def test_request_logging_with_query_params(self, test_client, reset_logging, capsys):
+    def test_request_logging_with_query_params(self, test_client, log_records):
         """Test that query parameters are logged"""
-        configure_logging("INFO")
-        
         # Make request with query params
         response = test_client.get("/test?param1=value1&param2=value2")
         
         # Verify response
         assert response.status_code == 200
         
-        # Capture stdout
-        captured = capsys.readouterr()
-        
         # Verify query params are in logs
-        assert "param1" in captured.out
-        assert "param2" in captured.out
+        started = _record(log_records, "Request started: GET /test")
+        assert started["query_params"] == {"param1": "value1", "param2": "value2"}
     
-    def test_response_logging_includes_status_code(self, test_client, reset_logging, capsys):
+    def test_response_logging_includes_status_code(self, test_client, log_records):
         """Test that response status code is logged"""
-        configure_logging("INFO")
-        
         # Make request
         response = test_client.get("/test")
         
         # Verify response
         assert response.status_code == 200
         
-        # Capture stdout
-        captured = capsys.readouterr()
-        
         # Verify status code is in logs
-        assert "status_code" in captured.out
-        assert "200" in captured.out
+        completed = _record(log_records, "Request completed: GET /test")
+        assert completed["status_code"] == 200
     
-    def test_response_logging_includes_processing_time(self, test_client, reset_logging, capsys):
+    def test_response_logging_includes_processing_time(self, test_client, log_records):
         """Test that processing time is logged"""
-        configure_logging("INFO")
-        
         # Make request
         response = test_client.get("/test")
         
         # Verify response
         assert response.status_code == 200
         
-        # Capture stdout
-        captured = capsys.readouterr()
-        
         # Verify processing time is in logs
-        assert "processing_time_ms" in captured.out
+        completed = _record(log_records, "Request completed: GET /test")
+        assert completed["processing_time_ms"] >= 0
     
-    def test_error_logging_on_exception(self, test_client, reset_logging, capsys):
+    def test_error_logging_on_exception(self, test_client, log_records):
         """Test that errors are logged when exceptions occur"""
-        configure_logging("INFO")
-        
         # Make request that raises exception
-        try:
-            response = test_client.get("/test-error")
-        except Exception:
-            pass  # Expected to fail
-        
-        # Capture stdout
-        captured = capsys.readouterr()
+        response = test_client.get("/test-error")
+        assert response.status_code == 500
         
         # Verify error was logged
-        assert "Request failed" in captured.out
-        assert "error" in captured.out
+        failed = _record(log_records, "Request failed: GET /test-error")
+        assert failed["level"] == "ERROR"
+        assert failed["error"] == "Test error"
+        assert failed["error_type"] == "ValueError"
 
 
 # ============================================================================
@@ -292,10 +329,8 @@ class TestRequestLoggingMiddleware:
 class TestExternalAPILogger:
     """Test suite for external API logging"""
     
-    def test_log_api_call_start(self, reset_logging, capsys):
+    def test_log_api_call_start(self, log_records):
         """Test logging the start of an API call"""
-        configure_logging("INFO")
-        
         api_logger = ExternalAPILogger("openai")
         
         start_time = api_logger.log_api_call_start(
@@ -308,17 +343,13 @@ class TestExternalAPILogger:
         assert isinstance(start_time, float)
         assert start_time > 0
         
-        # Capture stdout
-        captured = capsys.readouterr()
-        
         # Verify log was created
-        assert "External API call started" in captured.out
-        assert "openai" in captured.out
+        started = _record(log_records, "External API call started: openai.chat_completion")
+        assert started["service"] == "openai"
+        assert started["params"] == {"model": "gpt-4o", "messages": ["test"]}
     
-    def test_log_api_call_success(self, reset_logging, capsys):
+    def test_log_api_call_success(self, log_records):
         """Test logging successful API call completion"""
-        configure_logging("INFO")
-        
         api_logger = ExternalAPILogger("openai")
         
         start_time = api_logger.log_api_call_start("chat_completion")
@@ -328,17 +359,14 @@ class TestExternalAPILogger:
             tokens_used=100
         )
         
-        # Capture stdout
-        captured = capsys.readouterr()
-        
         # Verify success log was created
-        assert "External API call succeeded" in captured.out
-        assert "duration_ms" in captured.out
+        succeeded = _record(log_records, "External API call succeeded: openai.chat_completion")
+        assert succeeded["status"] == "success"
+        assert succeeded["tokens_used"] == 100
+        assert "duration_ms" in succeeded
     
-    def test_log_api_call_error(self, reset_logging, capsys):
+    def test_log_api_call_error(self, log_records):
         """Test logging API call errors with timestamp and context"""
-        configure_logging("INFO")
-        
         api_logger = ExternalAPILogger("whisper")
         
         # Create a test exception
@@ -352,12 +380,12 @@ class TestExternalAPILogger:
             status_code=429
         )
         
-        # Capture stdout
-        captured = capsys.readouterr()
-        
         # Verify error log was created
-        assert "External API call failed" in captured.out
-        assert "error" in captured.out
+        failed = _record(log_records, "External API call failed: whisper.transcribe")
+        assert failed["level"] == "ERROR"
+        assert failed["error"] == "API rate limit exceeded"
+        assert failed["status_code"] == 429
+        assert "timestamp" in failed
 
 
 # ============================================================================
@@ -367,10 +395,8 @@ class TestExternalAPILogger:
 class TestLogLevels:
     """Test suite for verifying appropriate log levels are used"""
     
-    def test_info_level_for_normal_operations(self, reset_logging, capsys):
+    def test_info_level_for_normal_operations(self, log_records):
         """Test that INFO level is used for normal operations"""
-        configure_logging("INFO")
-        
         logger = get_logger("test")
         
         log_with_context(
@@ -380,17 +406,11 @@ class TestLogLevels:
             operation="test"
         )
         
-        # Capture stdout
-        captured = capsys.readouterr()
-        
         # Verify INFO level log was created
-        assert "INFO" in captured.out
-        assert "Normal operation" in captured.out
+        assert _record(log_records, "Normal operation")["level"] == "INFO"
     
-    def test_error_level_for_failures(self, reset_logging, capsys):
+    def test_error_level_for_failures(self, log_records):
         """Test that ERROR level is used for failures"""
-        configure_logging("INFO")
-        
         logger = get_logger("test")
         
         log_with_context(
@@ -400,17 +420,11 @@ class TestLogLevels:
             error="Test error"
         )
         
-        # Capture stdout
-        captured = capsys.readouterr()
-        
         # Verify ERROR level log was created
-        assert "ERROR" in captured.out
-        assert "Operation failed" in captured.out
+        assert _record(log_records, "Operation failed")["level"] == "ERROR"
     
-    def test_debug_level_for_detailed_info(self, reset_logging, capsys):
+    def test_debug_level_for_detailed_info(self, log_records):
         """Test that DEBUG level can be used for detailed information"""
-        configure_logging("DEBUG")
-        
         logger = get_logger("test")
         
         log_with_context(
@@ -420,17 +434,11 @@ class TestLogLevels:
             details="test"
         )
         
-        # Capture stdout
-        captured = capsys.readouterr()
-        
         # Verify DEBUG level log was created
-        assert "DEBUG" in captured.out
-        assert "Detailed debug info" in captured.out
+        assert _record(log_records, "Detailed debug info")["level"] == "DEBUG"
     
-    def test_warning_level_for_warnings(self, reset_logging, capsys):
+    def test_warning_level_for_warnings(self, log_records):
         """Test that WARNING level can be used"""
-        configure_logging("INFO")
-        
         logger = get_logger("test")
         
         log_with_context(
@@ -440,12 +448,30 @@ class TestLogLevels:
             warning="test"
         )
         
-        # Capture stdout
-        captured = capsys.readouterr()
-        
         # Verify WARNING level log was created
-        assert "WARNING" in captured.out
-        assert "Warning message" in captured.out
+        assert _record(log_records, "Warning message")["level"] == "WARNING"
+    
+    def test_disabled_level_skips_record(self, log_records, monkeypatch):
+        """Test that a disabled level emits nothing and never serializes context"""
+        logger = get_logger("test")
+        previous_level = logger.level
+        dumps = Mock()
+        monkeypatch.setattr("app.utils.logger._dumps", dumps)
+        
+        logger.setLevel(logging.WARNING)
+        try:
+            log_with_context(
+                logger,
+                logging.INFO,
+                "Suppressed message",
+                context={"operation": "test"}
+            )
+        finally:
+            logger.setLevel(previous_level)
+        
+        # Verify no record was emitted and the context was never serialized
+        assert log_records == []
+        dumps.assert_not_called()
 
 
 # ============================================================================
@@ -25,6 +25,7 @@ from app.models import (
     Session,
     Question,
 )
+from tests._helpers import invalid_uuids as nonempty_invalid_uuids, valid_answer_text, valid_feedback_text, valid_topics
 
 
 # ============================================================================
@@ -34,19 +35,11 @@ from app.models import (
 # Valid strategies
 valid_difficulties = st.sampled_from([Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD])
 valid_uuids = st.builds(lambda: str(uuid4()))
-valid_topics = st.text(min_size=1, max_size=200)
-valid_answer_text = st.text(min_size=1, max_size=5000)
-valid_feedback_text = st.text(min_size=1, max_size=5000)
 
 # Invalid strategies
 invalid_difficulties = st.text().filter(lambda x: x not in ["Easy", "Medium", "Hard"])
-invalid_uuids = st.one_of(
-    st.text().filter(lambda x: x and not _is_valid_uuid(x)),
-    st.just(""),
-    st.just("not-a-uuid"),
-    st.just("12345"),
-    st.just("invalid-uuid-format"),
-)
+# The shared invalid ids plus the empty string, which the validators also reject
+invalid_uuids = st.one_of(st.just(""), nonempty_invalid_uuids)
 empty_strings = st.just("")
 
 
@@ -60,11 +53,17 @@ def _is_valid_uuid(s: str) -> bool:
         return False
 
 
+# Model classes build their pydantic-core validators at import, so there is
+# nothing to warm up; the per-example cost left to trim is Hypothesis'
+# example database, so every property here runs derandomized without it
+_model_settings = settings(max_examples=50, database=None, derandomize=True)
+
+
 # ============================================================================
 # Property Tests for StartSessionRequest
 # ============================================================================
 
-@settings(max_examples=50)
+@_model_settings
 @given(topic=valid_topics, difficulty=valid_difficulties)
 def test_start_session_request_accepts_valid_inputs(topic, difficulty):
     """
@@ -78,7 +77,7 @@ def test_start_session_request_accepts_valid_inputs(topic, difficulty):
     assert request.initial_difficulty == difficulty
 
 
-@settings(max_examples=50)
+@_model_settings
 @given(difficulty=valid_difficulties)
 def test_start_session_request_rejects_missing_topic(difficulty):
     """
@@ -91,7 +90,7 @@ def test_start_session_request_rejects_missing_topic(difficulty):
         StartSessionRequest(initial_difficulty=difficulty)
 
 
-@settings(max_examples=50)
+@_model_settings
 @given(topic=valid_topics)
 def test_start_session_request_rejects_missing_difficulty(topic):
     """
@@ -104,7 +103,7 @@ def test_start_session_request_rejects_missing_difficulty(topic):
         StartSessionRequest(topic=topic)
 
 
-@settings(max_examples=50)
+@_model_settings
 @given(topic=valid_topics, invalid_difficulty=invalid_difficulties)
 def test_start_session_request_rejects_invalid_difficulty(topic, invalid_difficulty):
     """
@@ -117,7 +116,7 @@ def test_start_session_request_rejects_invalid_difficulty(topic, invalid_difficu
         StartSessionRequest(topic=topic, initial_difficulty=invalid_difficulty)
 
 
-@settings(max_examples=50)
+@_model_settings
 @given(topic=empty_strings, difficulty=valid_difficulties)
 def test_start_session_request_rejects_empty_topic(topic, difficulty):
     """
@@ -134,7 +133,7 @@ def test_start_session_request_rejects_empty_topic(topic, difficulty):
 # Property Tests for SubmitAnswerRequest
 # ============================================================================
 
-@settings(max_examples=50)
+@_model_settings
 @given(
     session_id=valid_uuids,
     question_id=valid_uuids,
@@ -157,7 +156,7 @@ def test_submit_answer_request_accepts_valid_inputs(session_id, question_id, ans
     assert request.answer_text == answer_text
 
 
-@settings(max_examples=50)
+@_model_settings
 @given(
     invalid_session_id=invalid_uuids,
     question_id=valid_uuids,
@@ -178,7 +177,7 @@ def test_submit_answer_request_rejects_invalid_session_id(invalid_session_id, qu
         )
 
 
-@settings(max_examples=50)
+@_model_settings
 @given(
     session_id=valid_uuids,
     invalid_question_id=invalid_uuids,
@@ -199,7 +198,7 @@ def test_submit_answer_request_rejects_invalid_question_id(session_id, invalid_q
         )
 
 
-@settings(max_examples=50)
+@_model_settings
 @given(
     session_id=valid_uuids,
     question_id=valid_uuids,
@@ -220,7 +219,7 @@ def test_submit_answer_request_rejects_empty_answer(session_id, question_id, emp
         )
 
 
-@settings(max_examples=50)
+@_model_settings
 @given(question_id=valid_uuids, answer_text=valid_answer_text)
 def test_submit_answer_request_rejects_missing_session_id(question_id, answer_text):
     """
@@ -237,7 +236,7 @@ def test_submit_answer_request_rejects_missing_session_id(question_id, answer_te
 # Property Tests for VoiceFeedbackRequest
 # ============================================================================
 
-@settings(max_examples=50)
+@_model_settings
 @given(feedback_text=valid_feedback_text)
 def test_voice_feedback_request_accepts_valid_inputs(feedback_text):
     """
@@ -250,7 +249,7 @@ def test_voice_feedback_request_accepts_valid_inputs(feedback_text):
     assert request.feedback_text == feedback_text
 
 
-@settings(max_examples=50)
+@_model_settings
 @given(empty_feedback=empty_strings)
 def test_voice_feedback_request_rejects_empty_feedback(empty_feedback):
     """
@@ -278,7 +277,7 @@ def test_voice_feedback_request_rejects_missing_feedback():
 # Property Tests for Session Model
 # ============================================================================
 
-@settings(max_examples=50)
+@_model_settings
 @given(topic=valid_topics, difficulty=valid_difficulties)
 def test_session_model_accepts_valid_inputs(topic, difficulty):
     """
@@ -293,7 +292,7 @@ def test_session_model_accepts_valid_inputs(topic, difficulty):
     assert _is_valid_uuid(session.session_id)
 
 
-@settings(max_examples=50)
+@_model_settings
 @given(invalid_session_id=invalid_uuids, topic=valid_topics, difficulty=valid_difficulties)
 def test_session_model_rejects_invalid_session_id(invalid_session_id, topic, difficulty):
     """
@@ -310,7 +309,7 @@ def test_session_model_rejects_invalid_session_id(invalid_session_id, topic, dif
 # Property Tests for Question Model
 # ============================================================================
 
-@settings(max_examples=50)
+@_model_settings
 @given(
     question_text=valid_answer_text,
     difficulty=valid_difficulties,
@@ -330,7 +329,7 @@ def test_question_model_accepts_valid_inputs(question_text, difficulty, topic):
     assert _is_valid_uuid(question.question_id)
 
 
-@settings(max_examples=50)
+@_model_settings
 @given(
     invalid_question_id=invalid_uuids,
     question_text=valid_answer_text,